@@ -129,6 +129,8 @@ export interface HeatmapComponentArgs extends BaseComponentArgs {
   categoryColors?: Record<string, string>
   /** Use log10 transformation for intensity color mapping (default: true) */
   logScale?: boolean
+  /** Column holding log10 intensity computed in Python (used when logScale is on) */
+  logIntensityColumn?: string
   /** Custom label for the colorbar (default: "Intensity") */
   intensityLabel?: string
 }
@@ -1,5 +1,10 @@
 """Heatmap component using Plotly scattergl."""
 
+import math
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple
 
 import polars as pl
@@ -7,6 +12,7 @@ import polars as pl
 from ..core.base import BaseComponent
 from ..core.registry import register_component
 from ..preprocessing.compression import (
+    collect_streaming,
     compute_compression_levels,
     compute_optimal_bins,
     downsample_2d,
@@ -14,20 +20,132 @@ from ..preprocessing.compression import (
     downsample_2d_streaming,
     get_data_range,
 )
-from ..preprocessing.filtering import compute_dataframe_hash, filter_and_collect_cached
+from ..preprocessing.filtering import (
+    _make_cache_key,
+    compute_dataframe_hash,
+    filter_and_collect_polars,
+    optimize_for_transfer_lazy,
+)
+
+# Rendered payloads shared across reruns and Heatmap instances.
+# Keyed by (cache identity, zoom key, filter key) so that returning to a
+# previous zoom or filter selection skips level selection and collection.
+# Entries hold the immutable Polars frame; each caller gets its own pandas
+# copy, so no session can modify a payload another session is served.
+_RENDER_CACHE_MAX_ENTRIES = 32
+_render_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+_render_cache_lock = threading.Lock()
+
+# Compressed levels materialized in memory, shared across reruns and instances.
+# Avoids re-reading and re-decoding level parquet files on every zoom. The
+# full-resolution level and levels above the row limit always stay lazy.
+# The cache is per process and shared by every session, so it is bounded by
+# estimated size as well as entry count: together with the filtered-level
+# cache below, the worst case is about 384 MiB regardless of how many
+# heatmaps or sessions are served. A level larger than the budget on its own
+# is returned but not kept.
+_LEVEL_CACHE_MAX_ENTRIES = 16
+_LEVEL_CACHE_MAX_BYTES = 256 * 1024 * 1024
+_LEVEL_MATERIALIZE_MAX_ROWS = 1_000_000
+_level_cache: "OrderedDict[tuple, pl.DataFrame]" = OrderedDict()
+_level_cache_sizes: Dict[tuple, int] = {}
+_level_cache_lock = threading.Lock()
+
+# In-memory levels with render-time filters applied, keyed by
+# (id(level), filter key). The source level is stored alongside the result
+# and compared by identity on lookup, so a recycled id never matches. Panning
+# and zooming under a fixed filter selection then filters each level once.
+# Each entry is charged for both frames, since it keeps the source level alive
+# even after the level cache has evicted it.
+_FILTERED_LEVEL_CACHE_MAX_ENTRIES = 64
+_FILTERED_LEVEL_CACHE_MAX_BYTES = 128 * 1024 * 1024
+_filtered_level_cache: "OrderedDict[tuple, Tuple[pl.DataFrame, pl.DataFrame]]" = (
+    OrderedDict()
+)
+_filtered_level_cache_sizes: Dict[tuple, int] = {}
+_filtered_level_cache_lock = threading.Lock()
+
+
+def _evict_to_budget(
+    cache: OrderedDict,
+    sizes: Dict[tuple, int],
+    max_entries: int,
+    max_bytes: int,
+) -> None:
+    """Drop least recently used entries until the cache fits its budget.
+
+    Must be called with the cache's lock held. ``sizes`` holds the estimated
+    size of every entry and is kept in step with ``cache``.
+    """
+    total = sum(sizes.values())
+    while cache and (len(cache) > max_entries or total > max_bytes):
+        key, _ = cache.popitem(last=False)
+        total -= sizes.pop(key)
+
+
+# Significant digits of the axis span kept in zoom bounds. Bounds are rounded
+# to between 1/1000 and 1/10000 of the visible range, well below one pixel,
+# so near-identical relayout events share one render cache entry.
+_ZOOM_BOUNDS_PRECISION = 3
+
+
+def _round_range(lo: float, hi: float) -> Tuple[float, float]:
+    """Round an axis range to a step relative to its span."""
+    span = abs(hi - lo)
+    if not span or not math.isfinite(span):
+        return lo, hi
+    digits = _ZOOM_BOUNDS_PRECISION - math.floor(math.log10(span))
+    return round(lo, digits), round(hi, digits)
+
+
+# log10 intensity used for coloring when log_scale is enabled. Added to each
+# payload as it is built (and so render-cached with it), rather than stored in
+# the level files, so the browser does not recompute Math.log10 per point.
+_LOG_INTENSITY_COLUMN = "_log_intensity"
+
+
+def _zoom_bounds(zoom: Optional[Dict[str, Any]]) -> Optional[tuple]:
+    """
+    Read zoom bounds once as a flat, rounded (x0, x1, y0, y1) tuple.
+
+    Returns None for the full view: no zoom state, a missing range, or the
+    all-negative sentinel sent by the Vue component on reset.
+    """
+    x_range = zoom.get("xRange") if zoom else None
+    y_range = zoom.get("yRange") if zoom else None
+    if not x_range or not y_range:
+        return None
+    x0, x1 = x_range
+    y0, y1 = y_range
+    if x0 < 0 and x1 < 0 and y0 < 0 and y1 < 0:
+        return None
+    return (*_round_range(x0, x1), *_round_range(y0, y1))
+
+
+def _to_pandas_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a cached payload with its points converted to a new pandas frame.
+
+    Streamlit ships the pandas frame as an Arrow table, so the Vue side
+    receives one typed buffer per column rather than one Python object per
+    point.
+    """
+    result = dict(payload)
+    result["heatmapData"] = payload["heatmapData"].to_pandas()
+    return result
+
+
+def _available_columns(columns: List[str], names: List[str]) -> List[str]:
+    """Keep the requested columns present in names, in requested order."""
+    present = frozenset(names)
+    return [c for c in columns if c in present]
 
 
 # Cache key only includes zoom state (not other selections)
 def _make_zoom_cache_key(zoom: Optional[Dict[str, Any]]) -> tuple:
-    """Create hashable cache key from zoom state."""
-    if zoom is None:
-        return (None,)
-    return (
-        ("x0", zoom.get("xRange", [-1, -1])[0]),
-        ("x1", zoom.get("xRange", [-1, -1])[1]),
-        ("y0", zoom.get("yRange", [-1, -1])[0]),
-        ("y1", zoom.get("yRange", [-1, -1])[1]),
-    )
+    """Create hashable cache key from zoom state (empty for the full view)."""
+    bounds = _zoom_bounds(zoom)
+    return bounds if bounds is not None else ()
 
 
 @register_component("heatmap")
@@ -131,7 +249,7 @@ class Heatmap(BaseComponent):
             y_label: Y-axis label (defaults to y_column)
             colorscale: Plotly colorscale name (default: 'Portland')
             use_simple_downsample: If True, use simple top-N downsampling instead
-                of spatial binning (doesn't require scipy)
+                of spatial binning
             use_streaming: If True (default), use streaming downsampling that
                 stays lazy until render time. Reduces memory on init.
             categorical_filters: List of filter identifiers that should have
@@ -179,6 +297,10 @@ class Heatmap(BaseComponent):
         self._intensity_label = intensity_label
         self._use_streaming = use_streaming
         self._categorical_filters = categorical_filters or []
+        self._cache_token: Optional[tuple] = None
+        self._columns_to_select: Optional[List[str]] = None
+        self._levels_memo: Dict[str, Any] = {}
+        self._levels_memo_source: Optional[Dict[str, Any]] = None
 
         super().__init__(
             cache_id=cache_id,
@@ -264,6 +386,26 @@ class Heatmap(BaseComponent):
         self._low_values_on_top = config.get("low_values_on_top", False)
         self._intensity_label = config.get("intensity_label")
         # category_colors is not stored in cache (render-time styling)
+        # Memoized level lists, columns and cache token belong to the
+        # previous cache
+        self._cache_token = None
+        self._levels_memo = {}
+        self._levels_memo_source = None
+        self._columns_to_select = None
+
+    def _get_row_group_size(self) -> int:
+        """
+        Get optimal row group size for parquet writing.
+
+        Levels are sorted by x, so each row group is an x-strip tile whose
+        min/max statistics bound its x and y extent. Small groups (10K)
+        let a zoom-window scan skip every tile outside the window before
+        any row is decoded.
+
+        Returns:
+            Number of rows per row group
+        """
+        return 10_000
 
     def get_state_dependencies(self) -> list:
         """
@@ -290,7 +432,18 @@ class Heatmap(BaseComponent):
         If categorical_filters is specified, creates separate compression levels
         for each unique value of those filters, ensuring constant point counts
         regardless of filter selection.
+
+        Only the columns needed for rendering are kept, so the cascade and
+        the level files never carry unused columns.
         """
+        # Project before any level is built (pushed down into the source scan).
+        # Columns absent from the data (e.g., an unused category_column) are
+        # skipped, as the render path does, rather than failing the scan.
+        source_columns = _available_columns(
+            self._get_columns_to_select(), self._get_raw_column_names()
+        )
+        self._raw_data = self._raw_data.select(source_columns)
+
         if self._categorical_filters:
             self._preprocess_with_categorical_filters()
         elif self._use_streaming:
@@ -306,6 +459,7 @@ class Heatmap(BaseComponent):
         y_range: tuple,
         cache_dir,
         prefix: str = "level",
+        total: Optional[int] = None,
     ) -> dict:
         """
         Build cascading compression levels from source data.
@@ -323,22 +477,37 @@ class Heatmap(BaseComponent):
             y_range: (y_min, y_max) for consistent bin boundaries
             cache_dir: Path to save parquet files
             prefix: Filename prefix (e.g., "level" or "cat_level_im_0")
+            total: Row count of source_data if already known (skips a count
+                query over the source)
 
         Returns:
-            Dict with level LazyFrames keyed by "{prefix}_{idx}" and "num_levels"
+            Dict with level LazyFrames keyed by "{prefix}_{idx}", "num_levels",
+            and per-level row counts (smallest first) under "{prefix}_counts"
         """
         import sys
 
         result = {}
         num_compressed = len(level_sizes)
+        counts = [0] * (num_compressed + 1)
 
         # Get total count
-        total = source_data.select(pl.len()).collect().item()
+        if total is None:
+            total = collect_streaming(source_data.select(pl.len())).item()
+
+        # Float64 → Float32 before anything is written: halves the bytes moved
+        # through every cascade step, cached level and render-time collect
+        # (same downcast the base class applies to eagerly saved levels)
+        source_data = optimize_for_transfer_lazy(source_data)
 
         # First: save full resolution as the largest level
         full_res_path = cache_dir / f"{prefix}_{num_compressed}.parquet"
         full_res = source_data.sort([self._x_column, self._y_column])
-        full_res.sink_parquet(full_res_path, compression="zstd")
+        full_res.sink_parquet(
+            full_res_path,
+            compression="zstd",
+            row_group_size=self._get_row_group_size(),
+        )
+        counts[num_compressed] = total
         print(
             f"[HEATMAP] Saved {prefix}_{num_compressed} ({total:,} pts)",
             file=sys.stderr,
@@ -379,7 +548,15 @@ class Heatmap(BaseComponent):
 
             # Sort and save immediately
             level = level.sort([self._x_column, self._y_column])
-            level.sink_parquet(level_path, compression="zstd")
+            level.sink_parquet(
+                level_path,
+                compression="zstd",
+                row_group_size=self._get_row_group_size(),
+            )
+            # Row count comes from parquet metadata, no data is read
+            counts[level_idx] = (
+                pl.scan_parquet(level_path).select(pl.len()).collect().item()
+            )
 
             print(
                 f"[HEATMAP] Saved {prefix}_{level_idx} (target {target_size:,} pts)",
@@ -396,6 +573,7 @@ class Heatmap(BaseComponent):
             result[f"{prefix}_{i}"] = pl.scan_parquet(level_path)
 
         result["num_levels"] = num_compressed + 1
+        result[f"{prefix}_counts"] = counts
 
         return result
 
@@ -448,7 +626,7 @@ class Heatmap(BaseComponent):
             )
 
         # Get total count
-        total = self._raw_data.select(pl.len()).collect().item()
+        total = collect_streaming(self._raw_data.select(pl.len())).item()
         self._preprocessed_data["total"] = total
 
         # Create cache directory for immediate level saving
@@ -470,17 +648,14 @@ class Heatmap(BaseComponent):
 
             column_name = self._filters[filter_id]
 
-            # Get unique values for this filter
-            unique_values = (
-                self._raw_data.select(pl.col(column_name))
-                .unique()
-                .collect()
-                .to_series()
-                .to_list()
-            )
-            unique_values = sorted(
-                [v for v in unique_values if v is not None and v >= 0]
-            )
+            # Get unique values and their row counts in a single scan
+            value_counts = collect_streaming(self._raw_data.group_by(column_name).len())
+            value_totals = {
+                value: count
+                for value, count in value_counts.iter_rows()
+                if value is not None and value >= 0
+            }
+            unique_values = sorted(value_totals)
 
             print(
                 f"[HEATMAP] Categorical filter '{filter_id}' ({column_name}): {len(unique_values)} unique values",
@@ -491,13 +666,17 @@ class Heatmap(BaseComponent):
                 unique_values
             )
 
-            # Create compression levels for each filter value using cascading
-            for filter_value in unique_values:
+            def build_value_levels(
+                filter_value,
+                filter_id=filter_id,
+                column_name=column_name,
+                value_totals=value_totals,
+            ):
                 # Filter data to this value
                 filtered_data = self._raw_data.filter(
                     pl.col(column_name) == filter_value
                 )
-                filtered_total = filtered_data.select(pl.len()).collect().item()
+                filtered_total = value_totals[filter_value]
 
                 # Compute level sizes for this filtered subset (2× for cache buffer)
                 level_sizes = compute_compression_levels(cache_target, filtered_total)
@@ -507,28 +686,44 @@ class Heatmap(BaseComponent):
                     file=sys.stderr,
                 )
 
-                # Store level sizes for this filter value
-                self._preprocessed_data[
-                    f"cat_level_sizes_{filter_id}_{filter_value}"
-                ] = level_sizes
-
                 # Build cascading levels using helper
-                prefix = f"cat_level_{filter_id}_{filter_value}"
                 levels_result = self._build_cascading_levels(
                     source_data=filtered_data,
                     level_sizes=level_sizes,
                     x_range=x_range,
                     y_range=y_range,
                     cache_dir=cache_dir,
-                    prefix=prefix,
+                    prefix=f"cat_level_{filter_id}_{filter_value}",
+                    total=filtered_total,
                 )
+                return level_sizes, levels_result
+
+            # Create compression levels for each filter value using cascading.
+            # Values are independent (each cascade only reads its own files)
+            # and Polars releases the GIL, so they are built concurrently.
+            max_workers = max(1, min(len(unique_values), os.cpu_count() or 1))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(build_value_levels, unique_values))
+
+            for filter_value, (level_sizes, levels_result) in zip(
+                unique_values, results
+            ):
+                # Store level sizes for this filter value
+                self._preprocessed_data[
+                    f"cat_level_sizes_{filter_id}_{filter_value}"
+                ] = level_sizes
 
                 # Copy results to preprocessed_data
+                prefix = f"cat_level_{filter_id}_{filter_value}"
                 for key, value in levels_result.items():
                     if key == "num_levels":
                         self._preprocessed_data[
                             f"cat_num_levels_{filter_id}_{filter_value}"
                         ] = value
+                    elif key == f"{prefix}_counts":
+                        self._preprocessed_data[
+                            f"cat_level_counts_{filter_id}_{filter_value}"
+                        ] = value
                     else:
                         self._preprocessed_data[key] = value
 
@@ -545,6 +740,7 @@ class Heatmap(BaseComponent):
             y_range=y_range,
             cache_dir=cache_dir,
             prefix="level",
+            total=total,
         )
 
         # Copy results to preprocessed_data
@@ -604,7 +800,7 @@ class Heatmap(BaseComponent):
             )
 
         # Get total count
-        total = self._raw_data.select(pl.len()).collect().item()
+        total = collect_streaming(self._raw_data.select(pl.len())).item()
         self._preprocessed_data["total"] = total
 
         # Compute target sizes for levels (use 2×min_points for smallest cache level)
@@ -623,6 +819,7 @@ class Heatmap(BaseComponent):
             y_range=y_range,
             cache_dir=cache_dir,
             prefix="level",
+            total=total,
         )
 
         # Copy results to preprocessed_data
@@ -639,8 +836,8 @@ class Heatmap(BaseComponent):
         """
         Eager preprocessing - levels are computed upfront.
 
-        Uses more memory at init but faster rendering. Uses scipy-based
-        downsampling for better spatial distribution.
+        Uses more memory at init but faster rendering. Uses per-bin top-N
+        downsampling (NumPy binning) for better spatial distribution.
         Data is sorted by x, y columns for efficient range query predicate pushdown.
         """
         import sys
@@ -672,7 +869,7 @@ class Heatmap(BaseComponent):
             )
 
         # Get total count
-        total = self._raw_data.select(pl.len()).collect().item()
+        total = collect_streaming(self._raw_data.select(pl.len())).item()
         self._preprocessed_data["total"] = total
 
         # Compute compression level target sizes (2× for cache buffer)
@@ -734,8 +931,13 @@ class Heatmap(BaseComponent):
         Get compression levels list for rendering.
 
         Reconstructs the levels list from preprocessed data,
-        adding full resolution at the end.
+        adding full resolution at the end. The list is built once per
+        loaded cache and reused on later calls.
         """
+        memo = self._get_levels_memo()
+        if "levels" in memo:
+            return memo["levels"]
+
         num_levels = self._preprocessed_data.get("num_levels", 0)
         levels = []
 
@@ -744,8 +946,21 @@ class Heatmap(BaseComponent):
             if level_data is not None:
                 levels.append(level_data)
 
+        memo["levels"] = levels
         return levels
 
+    def _get_levels_memo(self) -> Dict[str, Any]:
+        """
+        Return the per-instance memo of level lists.
+
+        The memo is tied to the current preprocessed data dict and starts
+        empty whenever that dict is replaced (preprocessing, cache reload).
+        """
+        if self._levels_memo_source is not self._preprocessed_data:
+            self._levels_memo = {}
+            self._levels_memo_source = self._preprocessed_data
+        return self._levels_memo
+
     def _get_categorical_levels(
         self,
         filter_id: str,
@@ -778,21 +993,48 @@ class Heatmap(BaseComponent):
 
         return levels, None  # Full resolution included in cached levels
 
+    def _get_level_counts(self, counts_key: str, levels: list) -> List[int]:
+        """
+        Get the total row count of each level (smallest first).
+
+        Counts are recorded during preprocessing. For caches built without
+        them (eager preprocessing, older caches) they are read once from the
+        parquet metadata and memoized.
+
+        Args:
+            counts_key: Preprocessed data key holding the counts
+            levels: Levels the counts belong to
+
+        Returns:
+            List of row counts, one per level
+        """
+        counts = self._preprocessed_data.get(counts_key)
+        if counts is None or len(counts) != len(levels):
+            counts = [
+                len(level)
+                if isinstance(level, pl.DataFrame)
+                else level.select(pl.len()).collect().item()
+                for level in levels
+            ]
+            self._preprocessed_data[counts_key] = counts
+        return counts
+
     def _get_levels_for_state(
         self, state: Dict[str, Any]
-    ) -> Tuple[list, Optional[pl.LazyFrame]]:
+    ) -> Tuple[list, Optional[pl.LazyFrame], List[int]]:
         """
         Get appropriate compression levels based on current filter state.
 
         If categorical_filters are configured and a matching filter value is
         selected in state, returns the per-value levels. Otherwise returns
-        the global levels.
+        the global levels. Results are memoized per level set for the
+        lifetime of the loaded cache.
 
         Args:
             state: Current selection state
 
         Returns:
-            Tuple of (levels list, raw data for full resolution)
+            Tuple of (levels list, raw data for full resolution, level row counts)
         """
         # Check if we have categorical filters and a selected value
         if self._preprocessed_data.get("has_categorical_filters"):
@@ -814,14 +1056,80 @@ class Heatmap(BaseComponent):
 
                 # Check if this value has per-filter levels
                 if selected_value in cat_filter_values[filter_id]:
+                    prefix = f"cat_level_{filter_id}_{selected_value}"
+                    memo = self._get_levels_memo()
+                    if prefix in memo:
+                        return memo[prefix]
                     levels, filtered_raw = self._get_categorical_levels(
                         filter_id, selected_value
                     )
                     if levels:
-                        return levels, filtered_raw
+                        counts = self._get_level_counts(
+                            f"cat_level_counts_{filter_id}_{selected_value}", levels
+                        )
+                        levels = self._materialize_levels(prefix, levels, counts)
+                        memo[prefix] = (levels, filtered_raw, counts)
+                        return memo[prefix]
 
         # Fall back to global levels
-        return self._get_levels(), self._raw_data
+        memo = self._get_levels_memo()
+        if "level" not in memo:
+            levels = self._get_levels()
+            counts = self._get_level_counts("level_counts", levels)
+            levels = self._materialize_levels("level", levels, counts)
+            memo["level"] = (levels, self._raw_data, counts)
+        return memo["level"]
+
+    def _materialize_levels(self, prefix: str, levels: list, counts: List[int]) -> list:
+        """
+        Replace compressed LazyFrame levels by in-memory DataFrames.
+
+        Collected levels are kept in a process-wide LRU cache so the parquet
+        files are decoded once rather than on every zoom. The last (full
+        resolution) level and levels larger than _LEVEL_MATERIALIZE_MAX_ROWS
+        stay lazy to bound memory.
+
+        Args:
+            prefix: Level key prefix (e.g., "level" or "cat_level_im_0")
+            levels: Levels as returned from preprocessed data (smallest first)
+            counts: Total row count per level
+
+        Returns:
+            List of levels where small compressed levels are DataFrames
+        """
+        token = self._get_cache_token()
+        result = []
+        for i, level in enumerate(levels):
+            if (
+                not isinstance(level, pl.LazyFrame)
+                or i == len(levels) - 1
+                or counts[i] > _LEVEL_MATERIALIZE_MAX_ROWS
+            ):
+                result.append(level)
+                continue
+
+            key = (token, f"{prefix}_{i}")
+            with _level_cache_lock:
+                df = _level_cache.get(key)
+                if df is not None:
+                    _level_cache.move_to_end(key)
+            if df is None:
+                df = level.collect()
+                # Levels are written sorted by x; flag it so zoom queries can
+                # binary-search the x window instead of scanning every row
+                if df[self._x_column].is_sorted():
+                    df = df.with_columns(pl.col(self._x_column).set_sorted())
+                with _level_cache_lock:
+                    _level_cache[key] = df
+                    _level_cache_sizes[key] = df.estimated_size()
+                    _evict_to_budget(
+                        _level_cache,
+                        _level_cache_sizes,
+                        _LEVEL_CACHE_MAX_ENTRIES,
+                        _LEVEL_CACHE_MAX_BYTES,
+                    )
+            result.append(df)
+        return result
 
     def _get_vue_component_name(self) -> str:
         """Return the Vue component name."""
@@ -833,11 +1141,148 @@ class Heatmap(BaseComponent):
 
     def _is_no_zoom(self, zoom: Optional[Dict[str, Any]]) -> bool:
         """Check if zoom state represents no zoom (full view)."""
-        if zoom is None:
-            return True
-        x_range = zoom.get("xRange", [-1, -1])
-        y_range = zoom.get("yRange", [-1, -1])
-        return x_range[0] < 0 and x_range[1] < 0 and y_range[0] < 0 and y_range[1] < 0
+        return _zoom_bounds(zoom) is None
+
+    def _filter_zoom_range(
+        self,
+        level_data: Any,
+        x0: float,
+        x1: float,
+        y0: float,
+        y1: float,
+        columns: Optional[List[str]] = None,
+    ) -> pl.LazyFrame:
+        """
+        Restrict a level to the zoom rectangle.
+
+        For in-memory levels flagged as sorted by x, the x window is located
+        with two binary searches (O(log n)) and sliced without copying, so
+        only the rows inside the x window are tested against the y bounds.
+        Lazy levels get a plain predicate that Polars pushes into the scan.
+
+        Args:
+            level_data: Level as DataFrame or LazyFrame
+            x0, x1: Zoom x bounds (inclusive)
+            y0, y1: Zoom y bounds (inclusive)
+            columns: Optional columns to project (missing ones are ignored)
+
+        Returns:
+            LazyFrame restricted to the zoom rectangle
+        """
+        if columns is not None:
+            if isinstance(level_data, pl.DataFrame):
+                schema_names = level_data.columns
+            else:
+                schema_names = level_data.collect_schema().names()
+            level_data = level_data.select(_available_columns(columns, schema_names))
+
+        if (
+            isinstance(level_data, pl.DataFrame)
+            and level_data[self._x_column].flags["SORTED_ASC"]
+        ):
+            x_values = level_data[self._x_column]
+            start = x_values.search_sorted(x0, side="left")
+            end = x_values.search_sorted(x1, side="right")
+            return (
+                level_data.slice(start, max(end - start, 0))
+                .lazy()
+                .filter((pl.col(self._y_column) >= y0) & (pl.col(self._y_column) <= y1))
+            )
+
+        if isinstance(level_data, pl.DataFrame):
+            level_data = level_data.lazy()
+        return level_data.filter(
+            (pl.col(self._x_column) >= x0)
+            & (pl.col(self._x_column) <= x1)
+            & (pl.col(self._y_column) >= y0)
+            & (pl.col(self._y_column) <= y1)
+        )
+
+    def _get_filtered_level(
+        self,
+        level_data: pl.DataFrame,
+        filters: Dict[str, str],
+        state: Dict[str, Any],
+        columns: Optional[List[str]] = None,
+    ) -> pl.DataFrame:
+        """
+        Apply render-time filters to an in-memory level, memoized per state.
+
+        Filtering preserves row order, so the sorted flag on the x column is
+        carried over and the zoom window can still be binary-searched.
+
+        Args:
+            level_data: Materialized compression level
+            filters: Filters to apply (excluding categorical ones)
+            state: Current selection state
+            columns: Optional columns to keep. Projected before filtering, so
+                unused columns of the level are never copied.
+
+        Returns:
+            Filtered level as a Polars DataFrame
+        """
+        if columns is not None:
+            columns = _available_columns(columns, level_data.columns)
+        key = (
+            id(level_data),
+            _make_cache_key(filters, state, self._filter_defaults),
+            tuple(columns) if columns is not None else None,
+        )
+        with _filtered_level_cache_lock:
+            entry = _filtered_level_cache.get(key)
+            if entry is not None and entry[0] is level_data:
+                _filtered_level_cache.move_to_end(key)
+                return entry[1]
+
+        filtered, _ = filter_and_collect_polars(
+            level_data,
+            filters,
+            state,
+            columns=columns,
+            filter_defaults=self._filter_defaults,
+        )
+        if (
+            level_data[self._x_column].flags["SORTED_ASC"]
+            and self._x_column in filtered.columns
+        ):
+            filtered = filtered.with_columns(pl.col(self._x_column).set_sorted())
+
+        with _filtered_level_cache_lock:
+            _filtered_level_cache[key] = (level_data, filtered)
+            _filtered_level_cache_sizes[key] = (
+                level_data.estimated_size() + filtered.estimated_size()
+            )
+            _evict_to_budget(
+                _filtered_level_cache,
+                _filtered_level_cache_sizes,
+                _FILTERED_LEVEL_CACHE_MAX_ENTRIES,
+                _FILTERED_LEVEL_CACHE_MAX_BYTES,
+            )
+        return filtered
+
+    def _is_complete_level(
+        self,
+        level_idx: int,
+        level_counts: Optional[List[int]],
+        filtered_raw: Optional[pl.LazyFrame],
+    ) -> bool:
+        """Check whether a level already holds every row of the largest level."""
+        return (
+            level_counts is not None
+            and filtered_raw is None
+            and level_idx < len(level_counts)
+            and level_counts[level_idx] >= level_counts[-1]
+        )
+
+    def _is_outside_data_range(
+        self, x0: float, x1: float, y0: float, y1: float
+    ) -> bool:
+        """Check whether the zoom window misses the cached data extent."""
+        x_range = self._preprocessed_data.get("x_range")
+        y_range = self._preprocessed_data.get("y_range")
+        if not x_range or not y_range or None in (*x_range, *y_range):
+            return False
+        return x1 < x_range[0] or x0 > x_range[1] or y1 < y_range[0] or y0 > y_range[1]
 
     def _select_level_for_zoom(
         self,
@@ -846,6 +1291,8 @@ class Heatmap(BaseComponent):
         levels: list,
         filtered_raw: Optional[pl.LazyFrame],
         non_categorical_filters: Dict[str, str],
+        level_counts: Optional[List[int]] = None,
+        columns: Optional[List[str]] = None,
     ) -> pl.DataFrame:
         """
         Select appropriate resolution level based on zoom range.
@@ -853,56 +1300,104 @@ class Heatmap(BaseComponent):
         Iterates from smallest to largest resolution, finding the smallest
         level that has at least min_points in the zoomed view.
 
+        A zoom window outside the data extent returns an empty frame without
+        touching any level. Levels are first probed with a scalar count query
+        and only collected once they are the level returned. A probed level
+        over min_points is downsampled straight from its zoom plan, so the
+        window is scanned once. Only on-disk levels with render-time filters
+        are collected directly (filter_and_collect_polars).
+
         Args:
             zoom: Zoom state with xRange and yRange
             state: Full selection state for applying filters
             levels: List of compression levels to use
             filtered_raw: Filtered raw data for full resolution (optional)
             non_categorical_filters: Filters to apply (excluding categorical ones)
+            level_counts: Optional total row count per level. Levels holding
+                fewer than min_points rows in total cannot satisfy the zoom
+                and are skipped without being collected; the walk stops early
+                at a level that already holds the complete dataset.
+            columns: Optional columns to keep. The projection is applied to
+                the lazy plan before collecting, so unused columns are never
+                read from the level files.
 
         Returns:
             Filtered Polars DataFrame at appropriate resolution
         """
         import sys
 
-        x0, x1 = zoom["xRange"]
-        y0, y1 = zoom["yRange"]
+        # Same rounded bounds as the render cache key, so a cached payload
+        # matches every zoom state that maps to its key
+        x0, x1 = _round_range(*zoom["xRange"])
+        y0, y1 = _round_range(*zoom["yRange"])
 
         # Add raw data as final level if available
         all_levels = list(levels)
         if filtered_raw is not None:
             all_levels.append(filtered_raw)
 
+        # Every level lies within the data extent recorded at preprocessing
+        # time; a zoom window outside it cannot contain any point
+        if all_levels and self._is_outside_data_range(x0, x1, y0, y1):
+            print("[HEATMAP] Zoom outside data range", file=sys.stderr)
+            return (
+                self._filter_zoom_range(all_levels[0], x0, x1, y0, y1, columns)
+                .head(0)
+                .collect()
+            )
+
         last_filtered = None
 
         for level_idx, level_data in enumerate(all_levels):
-            # Ensure we have a LazyFrame for filtering
-            if isinstance(level_data, pl.DataFrame):
-                level_data = level_data.lazy()
-
-            # Filter to zoom range
-            filtered_lazy = level_data.filter(
-                (pl.col(self._x_column) >= x0)
-                & (pl.col(self._x_column) <= x1)
-                & (pl.col(self._y_column) >= y0)
-                & (pl.col(self._y_column) <= y1)
-            )
+            # Skip levels that are too small overall to reach min_points in
+            # any zoom window (the largest level is always evaluated)
+            if (
+                level_counts is not None
+                and level_idx < len(level_counts)
+                and level_idx < len(all_levels) - 1
+                and level_counts[level_idx] < self._min_points
+            ):
+                continue
 
-            # Apply non-categorical filters if any
-            if non_categorical_filters:
-                # filter_and_collect_cached returns (pandas DataFrame, hash)
-                # We need Polars DataFrame for further processing
-                df_pandas, _ = filter_and_collect_cached(
+            if non_categorical_filters and not isinstance(level_data, pl.DataFrame):
+                # Lazy level: push zoom predicate into the scan, then filter
+                filtered_lazy = self._filter_zoom_range(
+                    level_data, x0, x1, y0, y1, columns
+                )
+                # Collect straight to Polars for further processing
+                filtered, _ = filter_and_collect_polars(
                     filtered_lazy,
                     non_categorical_filters,
                     state,
                     filter_defaults=self._filter_defaults,
                 )
-                filtered = pl.from_pandas(df_pandas)
+                count = len(filtered)
             else:
-                filtered = filtered_lazy.collect()
+                if non_categorical_filters:
+                    # In-memory level: filter once per filter state, then zoom
+                    level_data = self._get_filtered_level(
+                        level_data, non_categorical_filters, state, columns
+                    )
+                zoomed = self._filter_zoom_range(level_data, x0, x1, y0, y1, columns)
+                if level_idx < len(all_levels) - 1 and not self._is_complete_level(
+                    level_idx, level_counts, filtered_raw
+                ):
+                    # Count first (a scalar; on-disk levels read only the
+                    # pruned x/y columns), collect only the level returned
+                    count = zoomed.select(pl.len()).collect().item()
+                    if count < self._min_points:
+                        print(
+                            f"[HEATMAP] Level {level_idx}: {count} pts in zoom range",
+                            file=sys.stderr,
+                        )
+                        continue
+                    # Over the limit: downsample straight from the zoom plan
+                    # below instead of collecting the window first
+                    filtered = zoomed if count > self._min_points else zoomed.collect()
+                else:
+                    filtered = zoomed.collect()
+                    count = len(filtered)
 
-            count = len(filtered)
             last_filtered = filtered
             print(
                 f"[HEATMAP] Level {level_idx}: {count} pts in zoom range",
@@ -955,6 +1450,12 @@ class Heatmap(BaseComponent):
                         ).collect()
                 return filtered
 
+            # A level that already holds every row of the largest level
+            # (small datasets: compressed level == full resolution) cannot be
+            # improved upon - stop instead of re-filtering identical data
+            if self._is_complete_level(level_idx, level_counts, filtered_raw):
+                return filtered
+
         # Even largest level has fewer points than threshold
         return last_filtered if last_filtered is not None else pl.DataFrame()
 
@@ -966,7 +1467,11 @@ class Heatmap(BaseComponent):
         If categorical_filters are configured, uses per-filter-value levels
         to ensure constant point counts regardless of filter selection.
 
-        Returns pandas DataFrame for efficient Arrow serialization.
+        Returns pandas DataFrame for efficient Arrow serialization. Payloads
+        are memoized per (zoom, filter) state in a small LRU cache, so reruns
+        triggered by unrelated components skip level selection entirely. The
+        cache holds the Polars frame and every call converts it to a new
+        pandas frame, so callers may modify the result freely.
 
         Args:
             state: Current selection state from StateManager
@@ -974,9 +1479,33 @@ class Heatmap(BaseComponent):
         Returns:
             Dict with heatmapData (pandas DataFrame) and _hash for change detection
         """
-        import sys
+        render_key = self._get_render_cache_key(state)
+        with _render_cache_lock:
+            cached = _render_cache.get(render_key)
+            if cached is not None:
+                _render_cache.move_to_end(render_key)
+        if cached is not None:
+            return _to_pandas_payload(cached)
+
+        payload = self._compute_vue_data(state)
+
+        with _render_cache_lock:
+            _render_cache[render_key] = payload
+            while len(_render_cache) > _RENDER_CACHE_MAX_ENTRIES:
+                _render_cache.popitem(last=False)
+        return _to_pandas_payload(payload)
+
+    def _get_columns_to_select(self) -> List[str]:
+        """
+        Return the columns the Vue component needs, in display order.
 
-        zoom = state.get(self._zoom_identifier)
+        Covers the x/y/intensity columns, the category column, and every
+        column referenced by interactivity or filters. Levels are projected
+        to these columns at preprocessing time and again at collect time. The
+        list only depends on configuration, so it is built once per instance.
+        """
+        if self._columns_to_select is not None:
+            return self._columns_to_select
 
         # Build columns to select (filter out None values)
         columns_to_select = [
@@ -997,12 +1526,60 @@ class Heatmap(BaseComponent):
             for col in self._filters.values():
                 if col not in columns_to_select:
                     columns_to_select.append(col)
+        self._columns_to_select = columns_to_select
+        return columns_to_select
+
+    def _get_render_cache_key(self, state: Dict[str, Any]) -> tuple:
+        """
+        Build the render cache key for the current zoom and filter state.
+
+        Args:
+            state: Current selection state
+
+        Returns:
+            Hashable tuple identifying the rendered payload
+        """
+        filter_key = (
+            _make_cache_key(self._filters, state, self._filter_defaults)
+            if self._filters
+            else ()
+        )
+        return (
+            self._get_cache_token(),
+            _make_zoom_cache_key(state.get(self._zoom_identifier)),
+            filter_key,
+        )
+
+    def _get_cache_token(self) -> tuple:
+        """
+        Identify the current on-disk cache for process-wide memoization.
+
+        Combines the cache directory with the manifest's creation timestamp,
+        so regenerated caches never serve stale entries. The timestamp is
+        taken from the manifest parsed by _load_from_cache, so the manifest
+        is not read again.
+        """
+        if self._cache_token is None:
+            self._cache_token = (str(self._cache_dir), self._cache_created_at)
+        return self._cache_token
+
+    def _compute_vue_data(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Compute the heatmap payload for the given state (render cache miss).
+
+        Args:
+            state: Current selection state from StateManager
+
+        Returns:
+            Dict with heatmapData (Polars DataFrame) and _hash for change detection
+        """
+        import sys
+
+        zoom = state.get(self._zoom_identifier)
+        columns_to_select = self._get_columns_to_select()
 
         # Get levels based on current state (may use per-filter levels)
-        levels, filtered_raw = self._get_levels_for_state(state)
-        level_sizes = [
-            len(lvl) if isinstance(lvl, pl.DataFrame) else "?" for lvl in levels
-        ]
+        levels, filtered_raw, level_sizes = self._get_levels_for_state(state)
 
         # Determine which filters still need to be applied at render time
         # (filters not in categorical_filters need runtime application)
@@ -1026,71 +1603,87 @@ class Heatmap(BaseComponent):
                 file=sys.stderr,
             )
 
-            # Ensure we have a LazyFrame
-            if isinstance(data, pl.DataFrame):
-                data = data.lazy()
-
-            # Apply non-categorical filters if any - returns (pandas DataFrame, hash)
+            # Apply non-categorical filters if any
             if non_categorical_filters:
-                df_pandas, data_hash = filter_and_collect_cached(
+                df_polars, _ = filter_and_collect_polars(
                     data,
                     non_categorical_filters,
                     state,
                     columns=columns_to_select,
                     filter_defaults=self._filter_defaults,
                 )
-                # Sort for render order (last drawn = on top in scattergl)
-                # Default: ascending (high on top). low_values_on_top: descending (low on top)
-                if (
-                    self._intensity_column
-                    and self._intensity_column in df_pandas.columns
-                ):
-                    df_pandas = df_pandas.sort_values(
-                        self._intensity_column, ascending=not self._low_values_on_top
-                    ).reset_index(drop=True)
-            else:
-                # No filters to apply - levels already filtered by categorical filter
-                schema_names = data.collect_schema().names()
-                available_cols = [c for c in columns_to_select if c in schema_names]
-                df_polars = data.select(available_cols).collect()
-                # Sort for render order (last drawn = on top in scattergl)
-                # Default: ascending (high on top). low_values_on_top: descending (low on top)
-                if (
-                    self._intensity_column
-                    and self._intensity_column in df_polars.columns
-                ):
-                    df_polars = df_polars.sort(
-                        self._intensity_column, descending=self._low_values_on_top
-                    )
-                data_hash = compute_dataframe_hash(df_polars)
-                df_pandas = df_polars.to_pandas()
-        else:
-            # Zoomed - select appropriate level
-            print(f"[HEATMAP] Zoom {zoom} → selecting level...", file=sys.stderr)
-            df_polars = self._select_level_for_zoom(
-                zoom, state, levels, filtered_raw, non_categorical_filters
+                return self._build_vue_payload(df_polars)
+
+            # No filters to apply - levels already filtered by categorical filter.
+            # A materialized level is projected in place, without a lazy plan.
+            if isinstance(data, pl.DataFrame):
+                available_cols = _available_columns(columns_to_select, data.columns)
+                return self._build_vue_payload(data.select(available_cols))
+            schema_names = data.collect_schema().names()
+            available_cols = _available_columns(columns_to_select, schema_names)
+            return self._build_vue_payload(data.select(available_cols).collect())
+
+        # Zoomed - select appropriate level
+        print(f"[HEATMAP] Zoom {zoom} → selecting level...", file=sys.stderr)
+        df_polars = self._select_level_for_zoom(
+            zoom,
+            state,
+            levels,
+            filtered_raw,
+            non_categorical_filters,
+            level_counts=level_sizes,
+            columns=columns_to_select,
+        )
+        # Select only needed columns
+        available_cols = _available_columns(columns_to_select, df_polars.columns)
+        df_polars = df_polars.select(available_cols)
+        print(
+            f"[HEATMAP] Selected {len(df_polars)} pts for zoom, levels={level_sizes}",
+            file=sys.stderr,
+        )
+        return self._build_vue_payload(df_polars)
+
+    def _build_vue_payload(self, df_polars: pl.DataFrame) -> Dict[str, Any]:
+        """
+        Build the columnar heatmap payload from a collected Polars DataFrame.
+
+        Points are sorted for render order and hashed once; the frame stays in
+        Polars for the render cache. With log_scale coloring by intensity (no category
+        column), the log10 intensity is added as a Float32 column.
+
+        Args:
+            df_polars: Collected points, already projected to the needed columns
+
+        Returns:
+            Dict with heatmapData (Polars DataFrame) and _hash for change detection
+        """
+        # Sort for render order (last drawn = on top in scattergl)
+        # Default: ascending (high on top). low_values_on_top: descending (low on top)
+        if self._intensity_column and self._intensity_column in df_polars.columns:
+            df_polars = df_polars.sort(
+                self._intensity_column, descending=self._low_values_on_top
             )
-            # Select only needed columns
-            available_cols = [c for c in columns_to_select if c in df_polars.columns]
-            df_polars = df_polars.select(available_cols)
-            # Sort for render order (last drawn = on top in scattergl)
-            # Default: ascending (high on top). low_values_on_top: descending (low on top)
-            if self._intensity_column and self._intensity_column in df_polars.columns:
-                df_polars = df_polars.sort(
-                    self._intensity_column, descending=self._low_values_on_top
+            if self._sends_log_intensity():
+                intensity = pl.col(self._intensity_column)
+                # Same mapping as the Vue fallback: non-positive values → 0
+                df_polars = df_polars.with_columns(
+                    pl.when(intensity > 0)
+                    .then(intensity.log10())
+                    .otherwise(0.0)
+                    .cast(pl.Float32)
+                    .alias(_LOG_INTENSITY_COLUMN)
                 )
-            print(
-                f"[HEATMAP] Selected {len(df_polars)} pts for zoom, levels={level_sizes}",
-                file=sys.stderr,
-            )
-            data_hash = compute_dataframe_hash(df_polars)
-            df_pandas = df_polars.to_pandas()
-
         return {
-            "heatmapData": df_pandas,
-            "_hash": data_hash,
+            "heatmapData": df_polars,
+            "_hash": compute_dataframe_hash(df_polars),
         }
 
+    def _sends_log_intensity(self) -> bool:
+        """Whether payloads carry the log10 intensity used for coloring."""
+        return bool(
+            self._log_scale and self._intensity_column and not self._category_column
+        )
+
     def _get_component_args(self) -> Dict[str, Any]:
         """
         Get component arguments to send to Vue.
@@ -1122,6 +1715,8 @@ class Heatmap(BaseComponent):
 
         # Add log scale and intensity label configuration
         args["logScale"] = self._log_scale
+        if self._sends_log_intensity():
+            args["logIntensityColumn"] = _LOG_INTENSITY_COLUMN
         if self._intensity_label:
             args["intensityLabel"] = self._intensity_label
 
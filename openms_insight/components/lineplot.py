@@ -1,16 +1,38 @@
 """Line plot component using Plotly.js."""
 
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import polars as pl
 
 from ..core.base import BaseComponent
 from ..core.registry import register_component
-from ..preprocessing.filtering import filter_and_collect_cached
+from ..preprocessing.filtering import (
+    compute_dataframe_hash,
+    filter_and_collect_cached,
+    filter_and_collect_polars,
+)
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     from .sequenceview import SequenceView
 
+# Styling applied when the user does not override a key
+_DEFAULT_STYLING: Dict[str, Any] = {
+    "highlightColor": "#E4572E",
+    "selectedColor": "#F3A712",
+    "unhighlightedColor": "lightblue",
+    "highlightHiddenColor": "#1f77b4",
+    "annotationColors": {
+        "massButton": "#E4572E",
+        "selectedMassButton": "#F3A712",
+        "sequenceArrow": "#E4572E",
+        "selectedSequenceArrow": "#F3A712",
+        "background": "#f0f0f0",
+        "buttonHover": "#e0e0e0",
+    },
+}
+
 
 @register_component("lineplot")
 class LinePlot(BaseComponent):
@@ -63,6 +85,7 @@ class LinePlot(BaseComponent):
         annotation_column: Optional[str] = None,
         styling: Optional[Dict[str, Any]] = None,
         config: Optional[Dict[str, Any]] = None,
+        max_points: Optional[int] = None,
         **kwargs,
     ):
         """
@@ -102,8 +125,25 @@ class LinePlot(BaseComponent):
                 - unhighlightedColor: Color for normal points (default: 'lightblue')
                 - annotationBackground: Background color for annotations
             config: Additional Plotly config options
+            max_points: Optional cap on the number of peaks sent per render.
+                When the filtered data has more rows, only the tallest peaks
+                (by y_column) are kept, plus every highlighted or dynamically
+                annotated peak. Must be a positive integer. Default None sends
+                all peaks.
             **kwargs: Additional configuration options
+
+        Raises:
+            ValueError: If max_points is not a positive integer
         """
+        if max_points is not None and (
+            isinstance(max_points, bool)
+            or not isinstance(max_points, int)
+            or max_points <= 0
+        ):
+            raise ValueError(
+                f"max_points must be a positive integer, got {max_points!r}"
+            )
+
         self._x_column = x_column
         self._y_column = y_column
         self._title = title
@@ -113,6 +153,10 @@ class LinePlot(BaseComponent):
         self._annotation_column = annotation_column
         self._styling = styling or {}
         self._plot_config = config or {}
+        self._max_points = max_points
+        self._columns_to_select: Optional[List[str]] = None
+        self._merged_styling: Optional[Dict[str, Any]] = None
+        self._interactivity_columns: Optional[Dict[str, str]] = None
 
         # Dynamic annotations set at render time (not cached)
         self._dynamic_annotations: Optional[Dict[str, Any]] = None
@@ -137,6 +181,7 @@ class LinePlot(BaseComponent):
             annotation_column=annotation_column,
             styling=styling,
             config=config,
+            max_points=max_points,
             **kwargs,
         )
 
@@ -157,6 +202,7 @@ class LinePlot(BaseComponent):
             "y_label": self._y_label,
             "styling": self._styling,
             "plot_config": self._plot_config,
+            "max_points": self._max_points,
         }
 
     def _restore_cache_config(self, config: Dict[str, Any]) -> None:
@@ -170,6 +216,10 @@ class LinePlot(BaseComponent):
         self._y_label = config.get("y_label", self._y_column)
         self._styling = config.get("styling", {})
         self._plot_config = config.get("plot_config", {})
+        self._max_points = config.get("max_points")
+        self._columns_to_select = None
+        self._merged_styling = None
+        self._interactivity_columns = None
         # Initialize dynamic annotations (not cached)
         self._dynamic_annotations = None
         self._dynamic_title = None
@@ -194,8 +244,7 @@ class LinePlot(BaseComponent):
         """Validate columns exist in data schema."""
         super()._validate_mappings()
 
-        schema = self._raw_data.collect_schema()
-        column_names = schema.names()
+        column_names = self._get_raw_column_names()
 
         # Validate x and y columns exist
         for col_name, col_label in [
@@ -225,10 +274,12 @@ class LinePlot(BaseComponent):
         """
         Preprocess plot data.
 
-        Sorts by filter columns for efficient predicate pushdown, then
-        collects the LazyFrame for caching by base class.
+        Projects to the columns the plot needs and sorts by filter columns
+        for efficient predicate pushdown. The LazyFrame is then streamed to
+        the cache by the base class.
         """
-        data = self._raw_data
+        # Only the rendered columns are cached (pushed down into the scan)
+        data = self._raw_data.select(self._get_columns_to_select())
 
         # Sort by filter columns for efficient predicate pushdown.
         # This clusters identical filter values together, enabling Polars
@@ -273,23 +324,6 @@ class LinePlot(BaseComponent):
         Returns:
             Dict with plotData (pandas DataFrame) and _hash for change detection
         """
-        # Build list of columns to select (projection pushdown for efficiency)
-        columns_to_select = [self._x_column, self._y_column]
-        if self._highlight_column:
-            columns_to_select.append(self._highlight_column)
-        if self._annotation_column:
-            columns_to_select.append(self._annotation_column)
-        # Include columns needed for interactivity (e.g., peak_id)
-        if self._interactivity:
-            for col in self._interactivity.values():
-                if col not in columns_to_select:
-                    columns_to_select.append(col)
-        # Include filter columns for filtering to work
-        if self._filters:
-            for col in self._filters.values():
-                if col not in columns_to_select:
-                    columns_to_select.append(col)
-
         # Get cached data (DataFrame or LazyFrame)
         data = self._preprocessed_data.get("data")
         if data is None:
@@ -300,14 +334,28 @@ class LinePlot(BaseComponent):
         if isinstance(data, pl.DataFrame):
             data = data.lazy()
 
-        # Use cached filter+collect - returns (pandas DataFrame, hash)
-        df_pandas, data_hash = filter_and_collect_cached(
-            data,
-            self._filters,
-            state,
-            columns=columns_to_select,
-            filter_defaults=self._filter_defaults,
-        )
+        if self._max_points is None:
+            # Use cached filter+collect - returns (pandas DataFrame, hash)
+            df_pandas, data_hash = filter_and_collect_cached(
+                data,
+                self._filters,
+                state,
+                columns=self._get_columns_to_select(),
+                filter_defaults=self._filter_defaults,
+            )
+        else:
+            # Reduce in Polars so dropped peaks never reach pandas. The hash
+            # describes the frame that is actually sent.
+            df_polars, _ = filter_and_collect_polars(
+                data,
+                self._filters,
+                state,
+                columns=self._get_columns_to_select(),
+                filter_defaults=self._filter_defaults,
+            )
+            df_polars = self._limit_peaks(df_polars)
+            data_hash = compute_dataframe_hash(df_polars)
+            df_pandas = df_polars.to_pandas()
 
         # Determine which highlight/annotation columns to use
         highlight_col = self._highlight_column
@@ -316,30 +364,7 @@ class LinePlot(BaseComponent):
         # Apply dynamic annotations if set
         # Annotations are keyed by peak_id (stable identifier from interactivity column)
         if self._dynamic_annotations and len(df_pandas) > 0:
-            num_rows = len(df_pandas)
-            highlights = [False] * num_rows
-            annotations = [""] * num_rows
-
-            # Get the interactivity column to use for lookup (e.g., 'peak_id')
-            # Use the first interactivity column as the ID column for annotation lookup
-            id_column = None
-            if self._interactivity:
-                id_column = list(self._interactivity.values())[0]
-
-            # Apply annotations by peak_id lookup
-            if id_column and id_column in df_pandas.columns:
-                peak_ids = df_pandas[id_column].tolist()
-                for row_idx, peak_id in enumerate(peak_ids):
-                    if peak_id in self._dynamic_annotations:
-                        ann_data = self._dynamic_annotations[peak_id]
-                        highlights[row_idx] = ann_data.get("highlight", False)
-                        annotations[row_idx] = ann_data.get("annotation", "")
-            else:
-                # Fallback: use row index as key (legacy behavior)
-                for idx, ann_data in self._dynamic_annotations.items():
-                    if isinstance(idx, int) and 0 <= idx < num_rows:
-                        highlights[idx] = ann_data.get("highlight", False)
-                        annotations[idx] = ann_data.get("annotation", "")
+            highlights, annotations = self._dynamic_annotation_columns(df_pandas)
 
             # Add dynamic columns to dataframe
             df_pandas = df_pandas.copy()
@@ -373,30 +398,6 @@ class LinePlot(BaseComponent):
         Returns:
             Dict with all plot configuration for Vue
         """
-        # Default styling
-        default_styling = {
-            "highlightColor": "#E4572E",
-            "selectedColor": "#F3A712",
-            "unhighlightedColor": "lightblue",
-            "highlightHiddenColor": "#1f77b4",
-            "annotationColors": {
-                "massButton": "#E4572E",
-                "selectedMassButton": "#F3A712",
-                "sequenceArrow": "#E4572E",
-                "selectedSequenceArrow": "#F3A712",
-                "background": "#f0f0f0",
-                "buttonHover": "#e0e0e0",
-            },
-        }
-
-        # Merge user styling with defaults
-        styling = {**default_styling, **self._styling}
-        if "annotationColors" in self._styling:
-            styling["annotationColors"] = {
-                **default_styling["annotationColors"],
-                **self._styling["annotationColors"],
-            }
-
         # Use dynamic title if set, otherwise static title
         title = self._dynamic_title if self._dynamic_title else (self._title or "")
 
@@ -405,7 +406,7 @@ class LinePlot(BaseComponent):
             "title": title,
             "xLabel": self._x_label,
             "yLabel": self._y_label,
-            "styling": styling,
+            "styling": self._get_styling(),
             "config": self._plot_config,
             # Pass interactivity for click handling (sets selection on peak click)
             "interactivity": self._interactivity,
@@ -421,6 +422,92 @@ class LinePlot(BaseComponent):
 
         return args
 
+    def _limit_peaks(self, df: pl.DataFrame) -> pl.DataFrame:
+        """
+        Keep at most max_points peaks, preferring the tallest ones.
+
+        Highlighted peaks and peaks with a dynamic annotation (matched by
+        the first interactivity column, as in _dynamic_annotation_columns)
+        are always kept so they stay visible and annotated. The kept rows
+        retain their original order.
+
+        Args:
+            df: Filtered plot data
+
+        Returns:
+            DataFrame with at most max_points rows (more only if more
+            peaks are highlighted or annotated)
+        """
+        if df.height <= self._max_points:
+            return df
+
+        df = df.with_row_index("_row")
+        keep = pl.lit(False)
+        if self._highlight_column:
+            keep = pl.col(self._highlight_column).cast(pl.Boolean).fill_null(False)
+        id_column = (
+            next(iter(self._interactivity.values())) if self._interactivity else None
+        )
+        if self._dynamic_annotations and id_column in df.columns:
+            annotated = pl.col(id_column).is_in(list(self._dynamic_annotations))
+            keep = keep | annotated.fill_null(False)
+        highlighted = df.filter(keep)
+        budget = max(self._max_points - highlighted.height, 0)
+        tallest = df.filter(~keep).top_k(budget, by=self._y_column)
+
+        return pl.concat([highlighted, tallest]).sort("_row").drop("_row")
+
+    def _get_columns_to_select(self) -> List[str]:
+        """
+        Return the columns the Vue component needs.
+
+        Covers the x/y columns, the optional highlight and annotation
+        columns, and every column referenced by interactivity or filters.
+        The list only depends on configuration, so it is built once per
+        instance and reused on every render.
+        """
+        if self._columns_to_select is not None:
+            return self._columns_to_select
+
+        columns_to_select = [self._x_column, self._y_column]
+        if self._highlight_column:
+            columns_to_select.append(self._highlight_column)
+        if self._annotation_column:
+            columns_to_select.append(self._annotation_column)
+        # Include columns needed for interactivity (e.g., peak_id)
+        if self._interactivity:
+            for col in self._interactivity.values():
+                if col not in columns_to_select:
+                    columns_to_select.append(col)
+        # Include filter columns for filtering to work
+        if self._filters:
+            for col in self._filters.values():
+                if col not in columns_to_select:
+                    columns_to_select.append(col)
+
+        self._columns_to_select = columns_to_select
+        return columns_to_select
+
+    def _get_styling(self) -> Dict[str, Any]:
+        """
+        Return user styling merged over the defaults.
+
+        Built on first use and reset by with_styling() and with_annotations().
+        The nested annotationColors dict is always a fresh copy, so the
+        module-level defaults are never shared with an instance.
+        """
+        if self._merged_styling is not None:
+            return self._merged_styling
+
+        styling = {**_DEFAULT_STYLING, **self._styling}
+        styling["annotationColors"] = {
+            **_DEFAULT_STYLING["annotationColors"],
+            **self._styling.get("annotationColors", {}),
+        }
+
+        self._merged_styling = styling
+        return styling
+
     def with_styling(
         self,
         highlight_color: Optional[str] = None,
@@ -444,6 +531,7 @@ class LinePlot(BaseComponent):
             self._styling["selectedColor"] = selected_color
         if unhighlighted_color:
             self._styling["unhighlightedColor"] = unhighlighted_color
+        self._merged_styling = None
         return self
 
     def with_annotations(
@@ -475,6 +563,7 @@ class LinePlot(BaseComponent):
                 selected_button_color
             )
 
+        self._merged_styling = None
         return self
 
     def set_dynamic_annotations(
@@ -525,6 +614,49 @@ class LinePlot(BaseComponent):
         self._dynamic_title = None
         return self
 
+    def _dynamic_annotation_columns(
+        self, df_pandas: "pd.DataFrame"
+    ) -> Tuple[List[bool], List[str]]:
+        """
+        Build highlight and annotation columns from dynamic annotations.
+
+        Annotations are looked up by the first interactivity column (e.g.,
+        peak_id). Only the annotated peaks are visited, so the cost scales
+        with the number of annotations rather than the number of peaks.
+
+        Args:
+            df_pandas: Filtered plot data
+
+        Returns:
+            Tuple of (highlight flags, annotation labels), one entry per row
+        """
+        num_rows = len(df_pandas)
+        highlights = [False] * num_rows
+        annotations = [""] * num_rows
+
+        # Use the first interactivity column as the ID column for lookup
+        id_column = None
+        if self._interactivity:
+            id_column = list(self._interactivity.values())[0]
+
+        if id_column and id_column in df_pandas.columns:
+            # Map each annotated peak_id to the rows carrying it
+            peak_ids = df_pandas[id_column]
+            matched = peak_ids.isin(list(self._dynamic_annotations.keys()))
+            rows = matched.to_numpy().nonzero()[0]
+            for row_idx, peak_id in zip(rows, peak_ids.to_numpy()[rows]):
+                ann_data = self._dynamic_annotations[peak_id]
+                highlights[row_idx] = ann_data.get("highlight", False)
+                annotations[row_idx] = ann_data.get("annotation", "")
+        else:
+            # Fallback: use row index as key (legacy behavior)
+            for idx, ann_data in self._dynamic_annotations.items():
+                if isinstance(idx, int) and 0 <= idx < num_rows:
+                    highlights[idx] = ann_data.get("highlight", False)
+                    annotations[idx] = ann_data.get("annotation", "")
+
+        return highlights, annotations
+
     def _build_plot_config(
         self,
         highlight_col: Optional[str],
@@ -545,11 +677,22 @@ class LinePlot(BaseComponent):
             "yColumn": self._y_column,
             "highlightColumn": highlight_col,
             "annotationColumn": annotation_col,
-            "interactivityColumns": {
+            "interactivityColumns": self._get_interactivity_columns(),
+        }
+
+    def _get_interactivity_columns(self) -> Dict[str, str]:
+        """
+        Return the interactivity columns as an identity mapping for Vue.
+
+        Only depends on configuration, so it is built once per instance and
+        shared by every _plotConfig. Callers must not modify it.
+        """
+        if self._interactivity_columns is None:
+            self._interactivity_columns = {
                 col: col
                 for col in (self._interactivity.values() if self._interactivity else [])
-            },
-        }
+            }
+        return self._interactivity_columns
 
     def _strip_dynamic_columns(self, vue_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -608,31 +751,8 @@ class LinePlot(BaseComponent):
 
         if self._dynamic_annotations and len(df_pandas) > 0:
             # Apply dynamic annotations
+            highlights, annotations = self._dynamic_annotation_columns(df_pandas)
             df_pandas = df_pandas.copy()
-            num_rows = len(df_pandas)
-            highlights = [False] * num_rows
-            annotations = [""] * num_rows
-
-            # Get the interactivity column for lookup
-            id_column = None
-            if self._interactivity:
-                id_column = list(self._interactivity.values())[0]
-
-            # Apply annotations by peak_id lookup
-            if id_column and id_column in df_pandas.columns:
-                peak_ids = df_pandas[id_column].tolist()
-                for row_idx, peak_id in enumerate(peak_ids):
-                    if peak_id in self._dynamic_annotations:
-                        ann_data = self._dynamic_annotations[peak_id]
-                        highlights[row_idx] = ann_data.get("highlight", False)
-                        annotations[row_idx] = ann_data.get("annotation", "")
-            else:
-                # Fallback: use row index as key
-                for idx, ann_data in self._dynamic_annotations.items():
-                    if isinstance(idx, int) and 0 <= idx < num_rows:
-                        highlights[idx] = ann_data.get("highlight", False)
-                        annotations[idx] = ann_data.get("annotation", "")
-
             df_pandas["_dynamic_highlight"] = highlights
             df_pandas["_dynamic_annotation"] = annotations
             highlight_col = "_dynamic_highlight"
@@ -2,10 +2,13 @@
 
 import hashlib
 import json
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import polars as pl
 
 from ..core.registry import register_component
@@ -17,6 +20,82 @@ PROTON_MASS = 1.007276
 # Cache version - increment when cache format changes
 CACHE_VERSION = 1
 
+# Water mass added to the residue sum for the intact peptide
+H2O_MASS = 18.010565
+
+# Amino acid monoisotopic residue masses (fallback without pyOpenMS)
+AA_MASSES = {
+    "A": 71.037114,
+    "R": 156.101111,
+    "N": 114.042927,
+    "D": 115.026943,
+    "C": 103.009185,
+    "E": 129.042593,
+    "Q": 128.058578,
+    "G": 57.021464,
+    "H": 137.058912,
+    "I": 113.084064,
+    "L": 113.084064,
+    "K": 128.094963,
+    "M": 131.040485,
+    "F": 147.068414,
+    "P": 97.052764,
+    "S": 87.032028,
+    "T": 101.047679,
+    "U": 150.953633,
+    "W": 186.079313,
+    "Y": 163.063329,
+    "V": 99.068414,
+}
+
+# Ion type offsets added to prefix (a, b, c) or suffix (x, y, z) sums
+ION_OFFSETS = {
+    "a": -27.994915,
+    "b": 0.0,
+    "c": 17.026549,
+    "x": 43.989829,
+    "y": 18.010565,
+    "z": 1.991841,
+}
+
+# Offsets in series order, broadcast over all positions at once
+_PREFIX_IONS = ("a", "b", "c")
+_SUFFIX_IONS = ("x", "y", "z")
+_PREFIX_OFFSETS = np.array([ION_OFFSETS[ion] for ion in _PREFIX_IONS])
+_SUFFIX_OFFSETS = np.array([ION_OFFSETS[ion] for ion in _SUFFIX_IONS])
+
+# Residue masses indexed by ASCII code; unknown residues weigh 0.0
+_AA_MASS_LUT = np.zeros(128, dtype=np.float64)
+for _aa, _mass in AA_MASSES.items():
+    _AA_MASS_LUT[ord(_aa)] = _mass
+del _aa, _mass
+
+
+# Parsed sequences with their fragment and theoretical masses, shared across
+# reruns and instances. Browsing identifications revisits the same peptides,
+# so each sequence is parsed and fragmented once. Entries are read-only.
+# Failed computations (empty fragment lists or a zero theoretical mass) are
+# not stored, so a transient error does not stick for the whole process.
+_SEQUENCE_CACHE_MAX_ENTRIES = 1024
+_sequence_cache: "OrderedDict[str, Tuple[Any, ...]]" = OrderedDict()
+_sequence_cache_lock = threading.Lock()
+
+
+def _residue_masses(residues: List[str]) -> np.ndarray:
+    """Look up monoisotopic masses for a list of one-letter residues.
+
+    Args:
+        residues: One-letter amino acid codes
+
+    Returns:
+        Float64 array with one mass per residue (0.0 for unknown codes)
+    """
+    joined = "".join(residues)
+    if len(joined) == len(residues) and joined.isascii():
+        codes = np.frombuffer(joined.encode("ascii"), dtype=np.uint8)
+        return _AA_MASS_LUT[codes]
+    return np.array([AA_MASSES.get(aa, 0.0) for aa in residues], dtype=np.float64)
+
 
 def parse_openms_sequence(sequence_str: str) -> Tuple[List[str], List[Optional[float]]]:
     """Parse OpenMS sequence format to extract residues and modification mass shifts.
@@ -178,78 +257,24 @@ def calculate_fragment_masses_pyopenms(
 def _calculate_fragment_masses_simple(
     sequence_str: str,
 ) -> Dict[str, List[List[float]]]:
-    """Fallback fragment calculation without pyOpenMS."""
-    # Amino acid monoisotopic masses
-    AA_MASSES = {
-        "A": 71.037114,
-        "R": 156.101111,
-        "N": 114.042927,
-        "D": 115.026943,
-        "C": 103.009185,
-        "E": 129.042593,
-        "Q": 128.058578,
-        "G": 57.021464,
-        "H": 137.058912,
-        "I": 113.084064,
-        "L": 113.084064,
-        "K": 128.094963,
-        "M": 131.040485,
-        "F": 147.068414,
-        "P": 97.052764,
-        "S": 87.032028,
-        "T": 101.047679,
-        "U": 150.953633,
-        "W": 186.079313,
-        "Y": 163.063329,
-        "V": 99.068414,
-    }
-
-    # Ion type offsets
-    ION_OFFSETS = {
-        "a": -27.994915,
-        "b": 0.0,
-        "c": 17.026549,
-        "x": 43.989829,
-        "y": 18.010565,
-        "z": 1.991841,
-    }
+    """Fallback fragment calculation without pyOpenMS.
 
+    Prefix and suffix masses are running sums over the residue masses, so
+    each ion series is one cumulative sum plus a constant offset.
+    """
     # Extract plain sequence
     residues, _ = parse_openms_sequence(sequence_str)
-    n = len(residues)
-    result = {}
+    masses = _residue_masses(residues)
 
-    # Calculate prefix masses
-    prefix_masses = []
-    mass = 0.0
-    for aa in residues:
-        mass += AA_MASSES.get(aa, 0.0)
-        prefix_masses.append(mass)
-
-    # Calculate suffix masses
-    suffix_masses = []
-    mass = 0.0
-    for aa in reversed(residues):
-        mass += AA_MASSES.get(aa, 0.0)
-        suffix_masses.append(mass)
-    suffix_masses = list(reversed(suffix_masses))
-
-    # Prefix ions (a, b, c)
-    for ion_type in ["a", "b", "c"]:
-        masses = []
-        for i in range(n):
-            ion_mass = prefix_masses[i] + ION_OFFSETS[ion_type]
-            masses.append([ion_mass])
-        result[f"fragment_masses_{ion_type}"] = masses
-
-    # Suffix ions (x, y, z)
-    for ion_type in ["x", "y", "z"]:
-        masses = []
-        for i in range(n):
-            idx = n - i - 1
-            ion_mass = suffix_masses[idx] + ION_OFFSETS[ion_type]
-            masses.append([ion_mass])
-        result[f"fragment_masses_{ion_type}"] = masses
+    # Prefix sums for a/b/c; suffix sums (from the C-terminus) for x/y/z.
+    # One broadcast per terminus gives a (3, n) matrix of ion masses.
+    prefix_ions = _PREFIX_OFFSETS[:, None] + np.cumsum(masses)[None, :]
+    suffix_ions = _SUFFIX_OFFSETS[:, None] + np.cumsum(masses[::-1])[None, :]
+
+    result = {}
+    for ions, series in ((_PREFIX_IONS, prefix_ions), (_SUFFIX_IONS, suffix_ions)):
+        for ion_type, ion_masses in zip(ions, series.tolist()):
+            result[f"fragment_masses_{ion_type}"] = [[m] for m in ion_masses]
 
     return result
 
@@ -263,39 +288,46 @@ def get_theoretical_mass(sequence_str: str) -> float:
         return aa_seq.getMonoWeight()
     except ImportError:
         # Fallback
-        H2O = 18.010565
-        AA_MASSES = {
-            "A": 71.037114,
-            "R": 156.101111,
-            "N": 114.042927,
-            "D": 115.026943,
-            "C": 103.009185,
-            "E": 129.042593,
-            "Q": 128.058578,
-            "G": 57.021464,
-            "H": 137.058912,
-            "I": 113.084064,
-            "L": 113.084064,
-            "K": 128.094963,
-            "M": 131.040485,
-            "F": 147.068414,
-            "P": 97.052764,
-            "S": 87.032028,
-            "T": 101.047679,
-            "U": 150.953633,
-            "W": 186.079313,
-            "Y": 163.063329,
-            "V": 99.068414,
-        }
         residues, _ = parse_openms_sequence(sequence_str)
-        mass = H2O
-        for aa in residues:
-            mass += AA_MASSES.get(aa, 0.0)
-        return mass
+        return H2O_MASS + float(_residue_masses(residues).sum())
     except Exception:
         return 0.0
 
 
+def _get_sequence_masses(
+    sequence_str: str,
+) -> Tuple[List[str], List[Optional[float]], Dict[str, List[List[float]]], float]:
+    """Parse a sequence and compute its masses, memoized per sequence string.
+
+    Args:
+        sequence_str: Peptide sequence string (can include modifications)
+
+    Returns:
+        Tuple of (residues, modifications, fragment masses, theoretical mass).
+        The returned containers are shared between callers and must not be
+        modified. Results of a failed computation are returned but not cached.
+    """
+    with _sequence_cache_lock:
+        entry = _sequence_cache.get(sequence_str)
+        if entry is not None:
+            _sequence_cache.move_to_end(sequence_str)
+            return entry
+
+    residues, modifications = parse_openms_sequence(sequence_str)
+    fragment_masses = calculate_fragment_masses_pyopenms(sequence_str)
+    theoretical_mass = get_theoretical_mass(sequence_str)
+    entry = (residues, modifications, fragment_masses, theoretical_mass)
+    # Both calculations report errors as empty results instead of raising
+    if theoretical_mass == 0.0 or not any(fragment_masses.values()):
+        return entry
+
+    with _sequence_cache_lock:
+        _sequence_cache[sequence_str] = entry
+        while len(_sequence_cache) > _SEQUENCE_CACHE_MAX_ENTRIES:
+            _sequence_cache.popitem(last=False)
+    return entry
+
+
 # Default annotation configuration
 DEFAULT_ANNOTATION_CONFIG = {
     "ion_types": ["b", "y"],
@@ -725,14 +757,10 @@ class SequenceView:
         # Get sequence for current state
         sequence_str, precursor_charge = self._get_sequence_for_state(state)
 
-        # Parse sequence
-        residues, modifications = parse_openms_sequence(sequence_str)
-
-        # Calculate theoretical fragment masses
-        fragment_masses = calculate_fragment_masses_pyopenms(sequence_str)
-
-        # Calculate theoretical mass
-        theoretical_mass = get_theoretical_mass(sequence_str)
+        # Parse sequence and calculate fragment and theoretical masses
+        residues, modifications, fragment_masses, theoretical_mass = (
+            _get_sequence_masses(sequence_str)
+        )
 
         # Build sequence data structure
         sequence_data = {
@@ -761,9 +789,16 @@ class SequenceView:
             observed_masses = peaks_df["mass"].to_list()
             peak_ids = peaks_df["peak_id"].to_list()
 
-        # Create hash for change detection
-        hash_input = f"{sequence_str}:{peaks_df.height}:{precursor_charge}"
-        data_hash = hashlib.md5(hash_input.encode()).hexdigest()[:8]
+        # Create hash for change detection. Hashes the peak content, not just
+        # the peak count, so two spectra of one peptide with equally many
+        # peaks are still told apart. Row hashes are value-based for any
+        # peak_id dtype (raw buffers of string ids would be object pointers).
+        hasher = hashlib.blake2b(digest_size=8)
+        hasher.update(f"{sequence_str}:{precursor_charge}".encode())
+        if peaks_df.height > 0:
+            row_hashes = peaks_df.select("mass", "peak_id").hash_rows(seed=0)
+            hasher.update(row_hashes.to_numpy().tobytes())
+        data_hash = hasher.hexdigest()
 
         result = {
             "sequenceData": sequence_data,
@@ -2,7 +2,7 @@
 
 import logging
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import polars as pl
 
@@ -26,6 +26,16 @@ NUMERIC_DTYPES = (
     pl.Float64,
 )
 
+# Tabulator (sorter, hozAlign) for auto-generated column definitions, keyed by
+# base dtype so parametrized types like Datetime("us", "UTC") match too
+_DTYPE_SORTERS: Dict[Any, Tuple[str, Optional[str]]] = {
+    **dict.fromkeys(NUMERIC_DTYPES, ("number", "right")),
+    pl.Boolean: ("boolean", None),
+    pl.Date: ("date", None),
+    pl.Datetime: ("date", None),
+    pl.Time: ("date", None),
+}
+
 # Session state key for tracking last rendered selection per table component
 _LAST_SELECTION_KEY = "_svc_table_last_selection"
 # Session state key for tracking last sort/filter state per table component
@@ -330,26 +340,10 @@ class Table(BaseComponent):
                     "headerTooltip": True,
                 }
                 # Set sorter based on data type
-                if dtype in (
-                    pl.Int8,
-                    pl.Int16,
-                    pl.Int32,
-                    pl.Int64,
-                    pl.UInt8,
-                    pl.UInt16,
-                    pl.UInt32,
-                    pl.UInt64,
-                    pl.Float32,
-                    pl.Float64,
-                ):
-                    col_def["sorter"] = "number"
-                    col_def["hozAlign"] = "right"
-                elif dtype == pl.Boolean:
-                    col_def["sorter"] = "boolean"
-                elif dtype in (pl.Date, pl.Datetime, pl.Time):
-                    col_def["sorter"] = "date"
-                else:
-                    col_def["sorter"] = "string"
+                sorter, align = _DTYPE_SORTERS.get(dtype.base_type(), ("string", None))
+                col_def["sorter"] = sorter
+                if align:
+                    col_def["hozAlign"] = align
 
                 self._column_definitions.append(col_def)
 
@@ -362,18 +356,7 @@ class Table(BaseComponent):
         for name, dtype in zip(schema.names(), schema.dtypes()):
             meta: Dict[str, Any] = {}
 
-            if dtype in (
-                pl.Int8,
-                pl.Int16,
-                pl.Int32,
-                pl.Int64,
-                pl.UInt8,
-                pl.UInt16,
-                pl.UInt32,
-                pl.UInt64,
-                pl.Float32,
-                pl.Float64,
-            ):
+            if dtype in NUMERIC_DTYPES:
                 # Numeric column - compute min/max and unique count
                 stats = data.select(
                     [
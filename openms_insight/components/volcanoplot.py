@@ -218,7 +218,7 @@ class VolcanoPlot(BaseComponent):
         columns = list(dict.fromkeys(columns))
 
         # Select columns and compute -log10(pvalue)
-        schema_names = self._raw_data.collect_schema().names()
+        schema_names = self._get_raw_column_names()
         available_cols = [c for c in columns if c in schema_names]
 
         df = (
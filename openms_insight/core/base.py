@@ -2,7 +2,9 @@
 
 import hashlib
 import json
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
@@ -23,6 +25,29 @@ CACHE_VERSION = 3
 # This is the single source of truth for component height
 DEFAULT_COMPONENT_HEIGHT = 400
 
+# Types json.dumps writes as-is (dict keys may be any of these as well)
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _is_json_like(value: Any) -> bool:
+    """
+    Check whether json.dumps would accept a value, without encoding it.
+
+    Walks dicts, lists and tuples and accepts only the scalar types the
+    standard encoder supports, so large values are checked without building
+    the JSON string.
+    """
+    if isinstance(value, _JSON_SCALARS):
+        return True
+    if isinstance(value, (list, tuple)):
+        return all(_is_json_like(item) for item in value)
+    if isinstance(value, dict):
+        return all(
+            isinstance(key, _JSON_SCALARS) and _is_json_like(item)
+            for key, item in value.items()
+        )
+    return False
+
 
 class BaseComponent(ABC):
     """
@@ -99,6 +124,8 @@ class BaseComponent(ABC):
         self._cache_id = cache_id
         self._cache_dir = get_cache_dir(cache_path, cache_id)
         self._preprocessed_data: Dict[str, Any] = {}
+        self._cache_created_at: Optional[str] = None
+        self._raw_schema_cache: Optional[tuple] = None
 
         # Determine mode: reconstruction (no data) or creation (data provided)
         has_data = data is not None or data_path is not None
@@ -167,8 +194,7 @@ class BaseComponent(ABC):
         if self._raw_data is None:
             return  # Skip validation when loaded from cache
 
-        schema = self._raw_data.collect_schema()
-        column_names = schema.names()
+        column_names = self._get_raw_column_names()
 
         for identifier, column in self._filters.items():
             if column not in column_names:
@@ -184,6 +210,23 @@ class BaseComponent(ABC):
                     f"Available columns: {column_names}"
                 )
 
+    def _get_raw_column_names(self) -> List[str]:
+        """
+        Get column names of the raw data.
+
+        Resolving a LazyFrame schema walks its whole query plan, so the names
+        are remembered for the current raw data and shared between the base
+        and subclass validation and projection steps.
+
+        Returns:
+            List of column names in the raw data
+        """
+        cached = self._raw_schema_cache
+        if cached is None or cached[0] is not self._raw_data:
+            cached = (self._raw_data, self._raw_data.collect_schema().names())
+            self._raw_schema_cache = cached
+        return cached[1]
+
     def _get_cache_config(self) -> Dict[str, Any]:
         """
         Get configuration that affects cache validity.
@@ -267,6 +310,8 @@ class BaseComponent(ABC):
         self._filter_defaults = manifest.get("filter_defaults", {})
         self._interactivity = manifest.get("interactivity", {})
         self._config = manifest.get("config", {})
+        # Identifies this cache generation (changes when the cache is rebuilt)
+        self._cache_created_at = manifest.get("created_at")
 
         # Restore component-specific configuration
         self._restore_cache_config(manifest.get("config", {}))
@@ -328,35 +373,48 @@ class BaseComponent(ABC):
         # Save preprocessed data with type optimization for efficient transfer
         # Float64→Float32 reduces Arrow payload size
         # Int64→Int32 (when safe) avoids BigInt overhead in JavaScript
+        writes = []
         for key, value in self._preprocessed_data.items():
-            if isinstance(value, pl.LazyFrame):
+            if isinstance(value, (pl.LazyFrame, pl.DataFrame)):
                 filename = f"{key}.parquet"
                 filepath = preprocessed_dir / filename
+                manifest["data_files"][key] = filename
 
                 if files_already_saved and filepath.exists():
                     # File was saved during preprocessing (cascading) - just register it
-                    manifest["data_files"][key] = filename
-                else:
-                    # Apply streaming-safe optimization (Float64→Float32 only)
-                    # Int64 bounds checking would require collect(), breaking streaming
-                    value = optimize_for_transfer_lazy(value)
-                    value.sink_parquet(filepath, compression="zstd")
-                    manifest["data_files"][key] = filename
-            elif isinstance(value, pl.DataFrame):
-                filename = f"{key}.parquet"
-                filepath = preprocessed_dir / filename
-
-                if files_already_saved and filepath.exists():
-                    # File was saved during preprocessing - just register it
-                    manifest["data_files"][key] = filename
-                else:
-                    # Full optimization including Int64→Int32 with bounds checking
-                    value = optimize_for_transfer(value)
-                    value.write_parquet(filepath, compression="zstd")
-                    manifest["data_files"][key] = filename
+                    continue
+                writes.append((value, filepath))
             elif self._is_json_serializable(value):
                 manifest["data_values"][key] = value
 
+        def write_file(item: tuple) -> None:
+            value, filepath = item
+            if isinstance(value, pl.LazyFrame):
+                # Apply streaming-safe optimization (Float64→Float32 only)
+                # Int64 bounds checking would require collect(), breaking streaming
+                optimize_for_transfer_lazy(value).sink_parquet(
+                    filepath,
+                    compression="zstd",
+                    row_group_size=self._get_row_group_size(),
+                )
+            else:
+                # Full optimization including Int64→Int32 with bounds checking
+                optimize_for_transfer(value).write_parquet(
+                    filepath,
+                    compression="zstd",
+                    row_group_size=self._get_row_group_size(),
+                )
+
+        # Files are independent and Polars releases the GIL while writing,
+        # so several files (e.g., eager heatmap levels) are written concurrently
+        if len(writes) > 1:
+            max_workers = min(len(writes), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(write_file, writes))
+        else:
+            for item in writes:
+                write_file(item)
+
         # Write manifest
         with open(self._get_manifest_path(), "w") as f:
             json.dump(manifest, f, indent=2)
@@ -364,17 +422,14 @@ class BaseComponent(ABC):
         # Release memory - data is now safely on disk
         self._preprocessed_data = {}
         self._raw_data = None
+        self._raw_schema_cache = None
 
         # Reload as lazy scan_parquet() references
         self._load_from_cache()
 
     def _is_json_serializable(self, value: Any) -> bool:
         """Check if value can be JSON serialized."""
-        try:
-            json.dumps(value)
-            return True
-        except (TypeError, ValueError):
-            return False
+        return _is_json_like(value)
 
     def _get_row_group_size(self) -> int:
         """
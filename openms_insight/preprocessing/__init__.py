@@ -7,6 +7,7 @@ from .compression import (
 )
 from .filtering import (
     filter_and_collect_cached,
+    filter_and_collect_polars,
     filter_by_index,
     filter_by_selection,
 )
@@ -19,6 +20,7 @@ __all__ = [
     "filter_by_selection",
     "filter_by_index",
     "filter_and_collect_cached",
+    "filter_and_collect_polars",
     "compute_compression_levels",
     "downsample_2d",
     "downsample_2d_simple",
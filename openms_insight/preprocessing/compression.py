@@ -13,11 +13,35 @@ import numpy as np
 import polars as pl
 
 try:
-    from scipy.stats import binned_statistic_2d
+    from numba import get_num_threads, njit, prange
 
-    HAS_SCIPY = True
+    HAS_NUMBA = True
 except ImportError:
-    HAS_SCIPY = False
+    HAS_NUMBA = False
+
+
+def collect_streaming(data: pl.LazyFrame) -> pl.DataFrame:
+    """
+    Collect a LazyFrame with the Polars streaming engine.
+
+    Used for the full-data queries of preprocessing (counts, ranges, unique
+    values, eager downsampling), where streaming keeps peak memory bounded
+    by the batch size instead of the dataset. Operations the streaming
+    engine does not support fall back to the in-memory engine inside Polars.
+    Polars releases without the ``engine`` argument (TypeError), or whose
+    ``engine`` argument predates the "streaming" name (ValueError), collect
+    in memory. A genuine query error is raised again by that collect.
+
+    Args:
+        data: LazyFrame to collect
+
+    Returns:
+        Collected DataFrame
+    """
+    try:
+        return data.collect(engine="streaming")
+    except (TypeError, ValueError):
+        return data.collect()
 
 
 def compute_optimal_bins(
@@ -125,6 +149,111 @@ def compute_compression_levels(min_size: int, total: int) -> List[int]:
     return levels
 
 
+def compute_bin_indices_2d(
+    x: np.ndarray,
+    y: np.ndarray,
+    x_bins: int,
+    y_bins: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute uniform 2D bin indices for each point in a single vectorized pass.
+
+    Bin edges span the data range of each axis (like numpy.histogram2d);
+    points on the upper edge fall into the last bin. A degenerate axis
+    (min == max) is widened by 0.5 on each side.
+
+    Args:
+        x: X coordinates
+        y: Y coordinates
+        x_bins: Number of bins along x-axis
+        y_bins: Number of bins along y-axis
+
+    Returns:
+        Tuple of (x_bin, y_bin) int64 arrays with 0-based bin indices
+    """
+
+    x_lo, x_scale = _axis_scale(x, x_bins)
+    y_lo, y_scale = _axis_scale(y, y_bins)
+    x_bin = np.clip(((x - x_lo) * x_scale).astype(np.int64), 0, x_bins - 1)
+    y_bin = np.clip(((y - y_lo) * y_scale).astype(np.int64), 0, y_bins - 1)
+    return x_bin, y_bin
+
+
+def _axis_scale(values: np.ndarray, bins: int) -> Tuple[float, float]:
+    """Return (lower edge, bins per unit) for uniform binning of one axis."""
+    lo = float(values.min())
+    hi = float(values.max())
+    if hi == lo:
+        lo, hi = lo - 0.5, hi + 0.5
+    return lo, bins / (hi - lo)
+
+
+if HAS_NUMBA:
+
+    @njit(parallel=True, cache=True)
+    def _bin_counts_2d_numba(
+        x, y, x_lo, x_scale, y_lo, y_scale, x_bins, y_bins, n_chunks
+    ):
+        """Fused bin-index + count kernel with per-chunk private histograms."""
+        n = x.shape[0]
+        x_bin = np.empty(n, dtype=np.int64)
+        y_bin = np.empty(n, dtype=np.int64)
+        partial = np.zeros((n_chunks, x_bins * y_bins), dtype=np.int64)
+        chunk_size = (n + n_chunks - 1) // n_chunks
+        for c in prange(n_chunks):
+            start = c * chunk_size
+            stop = min(start + chunk_size, n)
+            for i in range(start, stop):
+                bx = min(max(int((x[i] - x_lo) * x_scale), 0), x_bins - 1)
+                by = min(max(int((y[i] - y_lo) * y_scale), 0), y_bins - 1)
+                x_bin[i] = bx
+                y_bin[i] = by
+                partial[c, bx * y_bins + by] += 1
+        return x_bin, y_bin, partial.sum(axis=0)
+
+
+def compute_bin_counts_2d(
+    x: np.ndarray,
+    y: np.ndarray,
+    x_bins: int,
+    y_bins: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute uniform 2D bin indices and the number of points per bin.
+
+    Uses a parallel numba kernel when numba is installed (one fused pass,
+    per-thread histograms), otherwise vectorized NumPy with np.bincount.
+
+    Args:
+        x: X coordinates
+        y: Y coordinates
+        x_bins: Number of bins along x-axis
+        y_bins: Number of bins along y-axis
+
+    Returns:
+        Tuple of (x_bin, y_bin, counts) where counts is a flat array of
+        length x_bins * y_bins indexed by x_bin * y_bins + y_bin
+    """
+    if HAS_NUMBA and len(x) > 0:
+        x_lo, x_scale = _axis_scale(x, x_bins)
+        y_lo, y_scale = _axis_scale(y, y_bins)
+        return _bin_counts_2d_numba(
+            np.ascontiguousarray(x, dtype=np.float64),
+            np.ascontiguousarray(y, dtype=np.float64),
+            x_lo,
+            x_scale,
+            y_lo,
+            y_scale,
+            x_bins,
+            y_bins,
+            get_num_threads(),
+        )
+
+    x_bin, y_bin = compute_bin_indices_2d(x, y, x_bins, y_bins)
+    counts = np.bincount(x_bin * y_bins + y_bin, minlength=x_bins * y_bins)
+    return x_bin, y_bin, counts
+
+
 def downsample_2d(
     data: Union[pl.LazyFrame, pl.DataFrame],
     max_points: int = 20000,
@@ -139,7 +268,9 @@ def downsample_2d(
 
     Uses 2D binning to spatially partition data, then keeps the top N
     highest-intensity points per bin. This preserves visually important
-    features (peaks) while reducing total point count.
+    features (peaks) while reducing total point count. Bin indices and
+    per-bin counts come from compute_bin_counts_2d (NumPy, or numba when
+    installed; no scipy needed).
 
     Args:
         data: Input data as Polars LazyFrame or DataFrame
@@ -154,14 +285,8 @@ def downsample_2d(
         Downsampled data as Polars LazyFrame
 
     Raises:
-        ImportError: If scipy is not installed
         ValueError: If x_bins * y_bins > max_points
     """
-    if not HAS_SCIPY:
-        raise ImportError(
-            "scipy is required for downsample_2d. Install with: pip install scipy"
-        )
-
     if (x_bins * y_bins) > max_points:
         raise ValueError(
             f"Number of bins ({x_bins * y_bins}) exceeds max_points ({max_points}). "
@@ -179,35 +304,25 @@ def downsample_2d(
         .sort(["_rank", intensity_column], descending=[False, True])
     )
 
-    # Collect for scipy binning (requires numpy arrays)
-    collected = sorted_data.collect()
+    # Collect for binning (requires numpy arrays)
+    collected = collect_streaming(sorted_data)
 
     total_count = len(collected)
     if total_count <= max_points:
         # No downsampling needed
         return collected.drop("_rank").lazy()
 
-    # Extract arrays for scipy
-    x_array = collected[x_column].to_numpy()
-    y_array = collected[y_column].to_numpy()
-    intensity_array = collected[intensity_column].to_numpy()
-
-    # Compute 2D bins
-    count, _, _, mapping = binned_statistic_2d(
-        x_array,
-        y_array,
-        intensity_array,
-        "count",
-        bins=[x_bins, y_bins],
-        expand_binnumbers=True,
+    # Compute 2D bin indices and per-bin counts
+    x_bin, y_bin, count = compute_bin_counts_2d(
+        collected[x_column].to_numpy(),
+        collected[y_column].to_numpy(),
+        x_bins,
+        y_bins,
     )
 
-    # Add bin indices to dataframe
+    # Add the flattened bin id (same indexing as count) to dataframe
     binned_data = collected.lazy().with_columns(
-        [
-            pl.Series("_x_bin", mapping[0] - 1),  # scipy uses 1-based indexing
-            pl.Series("_y_bin", mapping[1] - 1),
-        ]
+        pl.Series("_bin", x_bin * y_bins + y_bin)
     )
 
     # Compute max peaks per bin to stay under limit
@@ -218,17 +333,17 @@ def downsample_2d(
     while (counted_peaks + new_count) < max_points:
         max_peaks_per_bin += 1
         counted_peaks += new_count
-        new_count = np.sum(count.flatten() >= (max_peaks_per_bin + 1))
+        new_count = np.sum(count >= (max_peaks_per_bin + 1))
 
         if counted_peaks >= total_count:
             break
 
     # Keep top N peaks per bin
     result = (
-        binned_data.group_by(["_x_bin", "_y_bin"])
+        binned_data.group_by("_bin")
         .head(max_peaks_per_bin)
         .sort(intensity_column)
-        .drop(["_rank", "_x_bin", "_y_bin"])
+        .drop(["_rank", "_bin"])
     )
 
     return result
@@ -243,7 +358,7 @@ def downsample_2d_simple(
     """
     Simple downsampling by keeping top-priority points.
 
-    A simpler alternative to downsample_2d that doesn't require scipy.
+    A simpler alternative to downsample_2d that skips spatial binning.
     Less spatially aware but still preserves important peaks.
 
     Args:
@@ -303,64 +418,56 @@ def downsample_2d_streaming(
     total_bins = x_bins * y_bins
     points_per_bin = max(1, max_points // total_bins)
 
-    # Build binning expression using provided or computed ranges
-    if x_range is not None and y_range is not None:
-        x_min, x_max = x_range
-        y_min, y_max = y_range
-
-        # Use provided ranges for bin calculation
-        x_bin_expr = (
-            ((pl.col(x_column) - x_min) / (x_max - x_min + 1e-10) * x_bins)
-            .cast(pl.Int32)
-            .clip(0, x_bins - 1)
-            .alias("_x_bin")
-        )
-        y_bin_expr = (
-            ((pl.col(y_column) - y_min) / (y_max - y_min + 1e-10) * y_bins)
-            .cast(pl.Int32)
-            .clip(0, y_bins - 1)
-            .alias("_y_bin")
+    # One linear bin id per point: grouping on a single integer key hashes
+    # once per row instead of combining two keys
+    return (
+        data.with_columns(
+            _linear_bin_expr(x_column, y_column, x_bins, y_bins, x_range, y_range)
         )
+        .sort(intensity_column, descending=descending)
+        .group_by("_bin")
+        .head(points_per_bin)
+        .drop("_bin")
+    )
 
-        result = (
-            data.with_columns([x_bin_expr, y_bin_expr])
-            .sort(intensity_column, descending=descending)
-            .group_by(["_x_bin", "_y_bin"])
-            .head(points_per_bin)
-            .drop(["_x_bin", "_y_bin"])
-        )
+
+def _linear_bin_expr(
+    x_column: str,
+    y_column: str,
+    x_bins: int,
+    y_bins: int,
+    x_range: Optional[tuple] = None,
+    y_range: Optional[tuple] = None,
+) -> pl.Expr:
+    """
+    Build a lazy expression for the flattened 2D bin id (x_bin * y_bins + y_bin).
+
+    Args:
+        x_column: Name of x-axis column
+        y_column: Name of y-axis column
+        x_bins: Number of bins along x-axis
+        y_bins: Number of bins along y-axis
+        x_range: Optional (min, max) tuple for x-axis. If None, computed from
+            data with min/max aggregations over the entire frame.
+        y_range: Optional (min, max) tuple for y-axis. If None, computed from data.
+
+    Returns:
+        UInt32 expression aliased to "_bin"
+    """
+    if x_range is not None and y_range is not None:
+        # Known ranges: fold span and bin count into one scalar per axis,
+        # so each point costs a subtraction and a multiplication
+        x_min, y_min = pl.lit(x_range[0]), pl.lit(y_range[0])
+        x_scale = pl.lit(x_bins / (x_range[1] - x_range[0] + 1e-10))
+        y_scale = pl.lit(y_bins / (y_range[1] - y_range[0] + 1e-10))
     else:
-        # Need to compute ranges - still lazy using over() window
-        # First pass: add normalized bin columns using min/max over entire frame
-        result = (
-            data.with_columns(
-                [
-                    # Compute bin indices using window functions for min/max
-                    (
-                        (pl.col(x_column) - pl.col(x_column).min())
-                        / (pl.col(x_column).max() - pl.col(x_column).min() + 1e-10)
-                        * x_bins
-                    )
-                    .cast(pl.Int32)
-                    .clip(0, x_bins - 1)
-                    .alias("_x_bin"),
-                    (
-                        (pl.col(y_column) - pl.col(y_column).min())
-                        / (pl.col(y_column).max() - pl.col(y_column).min() + 1e-10)
-                        * y_bins
-                    )
-                    .cast(pl.Int32)
-                    .clip(0, y_bins - 1)
-                    .alias("_y_bin"),
-                ]
-            )
-            .sort(intensity_column, descending=descending)
-            .group_by(["_x_bin", "_y_bin"])
-            .head(points_per_bin)
-            .drop(["_x_bin", "_y_bin"])
-        )
+        x_min, y_min = pl.col(x_column).min(), pl.col(y_column).min()
+        x_scale = x_bins / (pl.col(x_column).max() - x_min + 1e-10)
+        y_scale = y_bins / (pl.col(y_column).max() - y_min + 1e-10)
 
-    return result
+    x_bin = ((pl.col(x_column) - x_min) * x_scale).cast(pl.Int32).clip(0, x_bins - 1)
+    y_bin = ((pl.col(y_column) - y_min) * y_scale).cast(pl.Int32).clip(0, y_bins - 1)
+    return (x_bin * y_bins + y_bin).cast(pl.UInt32).alias("_bin")
 
 
 def get_data_range(
@@ -391,7 +498,8 @@ def get_data_range(
             pl.col(y_column).min().alias("y_min"),
             pl.col(y_column).max().alias("y_max"),
         ]
-    ).collect()
+    )
+    stats = collect_streaming(stats)
 
     return (
         (stats["x_min"][0], stats["x_max"][0]),
@@ -1,11 +1,13 @@
 """Data filtering utilities for selection-based filtering."""
 
 import hashlib
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
-import pandas as pd
 import polars as pl
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 def optimize_for_transfer(df: pl.DataFrame) -> pl.DataFrame:
     """
@@ -91,6 +93,23 @@ def optimize_for_transfer_lazy(lf: pl.LazyFrame) -> pl.LazyFrame:
     return lf
 
 
+# Column types whose sum is folded into compute_dataframe_hash
+_SUMMABLE_DTYPES = frozenset(
+    [
+        pl.Int8,
+        pl.Int16,
+        pl.Int32,
+        pl.Int64,
+        pl.UInt8,
+        pl.UInt16,
+        pl.UInt32,
+        pl.UInt64,
+        pl.Float32,
+        pl.Float64,
+    ]
+)
+
+
 def _make_cache_key(
     filters: Dict[str, str],
     state: Dict[str, Any],
@@ -148,33 +167,23 @@ def compute_dataframe_hash(df: pl.DataFrame) -> str:
         hash_parts.append(str(first_row))
         hash_parts.append(str(last_row))
 
+        # Sum all numeric and boolean columns in a single parallel pass
+        # instead of one Series.sum() call per column
+        schema = df.schema
+        summed = [
+            col
+            for col, dtype in schema.items()
+            if dtype in _SUMMABLE_DTYPES or dtype == pl.Boolean
+        ]
+        sums = df.select(pl.col(summed).sum()).row(0, named=True) if summed else {}
+
         # Add sum of numeric columns for content verification
-        for col in df.columns:
-            dtype = df[col].dtype
-            if dtype in (
-                pl.Int8,
-                pl.Int16,
-                pl.Int32,
-                pl.Int64,
-                pl.UInt8,
-                pl.UInt16,
-                pl.UInt32,
-                pl.UInt64,
-                pl.Float32,
-                pl.Float64,
-            ):
-                try:
-                    col_sum = df[col].sum()
-                    hash_parts.append(f"{col}:{col_sum}")
-                except Exception:
-                    pass
+        for col, dtype in schema.items():
+            if dtype in _SUMMABLE_DTYPES:
+                hash_parts.append(f"{col}:{sums[col]}")
             elif dtype == pl.Boolean:
                 # Count True values for boolean columns (important for annotations)
-                try:
-                    true_count = df[col].sum()  # True=1, False=0
-                    hash_parts.append(f"{col}_bool:{true_count}")
-                except Exception:
-                    pass
+                hash_parts.append(f"{col}_bool:{sums[col]}")
             elif dtype == pl.Utf8 and col.startswith("_dynamic"):
                 # Hash content of dynamic string columns (annotations)
                 try:
@@ -189,19 +198,18 @@ def compute_dataframe_hash(df: pl.DataFrame) -> str:
     return hashlib.sha256(hash_input).hexdigest()
 
 
-def _filter_and_collect(
+def _filter_and_collect_polars(
     data: pl.LazyFrame,
     filters_tuple: Tuple[Tuple[str, str], ...],
     state_tuple: Tuple[Tuple[str, Any], ...],
     columns_tuple: Optional[Tuple[str, ...]] = None,
-) -> Tuple[pd.DataFrame, str]:
+) -> Tuple[pl.DataFrame, str]:
     """
-    Filter data and collect.
+    Filter data and collect as a Polars DataFrame.
 
-    This function executes the filter query. Caching is handled at a higher
-    level (per-component in bridge.py) to ensure memory = O(num_components).
-
-    Returns pandas DataFrame for efficient Arrow serialization to frontend.
+    Shared by _filter_and_collect and filter_and_collect_polars. Callers
+    that keep working in Polars use this directly and skip the pandas
+    conversion.
 
     Args:
         data: LazyFrame to filter
@@ -211,7 +219,7 @@ def _filter_and_collect(
         columns_tuple: Optional tuple of column names to select (projection)
 
     Returns:
-        Tuple of (pandas DataFrame, hash string)
+        Tuple of (Polars DataFrame, hash string)
     """
     filters = dict(filters_tuple)
     state = dict(state_tuple)  # Already has defaults applied
@@ -230,9 +238,7 @@ def _filter_and_collect(
             # No selection for this filter - return empty DataFrame
             # Collect with limit 0 to get schema without data
             df_polars = data.head(0).collect()
-            data_hash = compute_dataframe_hash(df_polars)
-            df_pandas = df_polars.to_pandas()
-            return (df_pandas, data_hash)
+            return (df_polars, compute_dataframe_hash(df_polars))
 
         # Convert float to int for integer columns to handle JSON number parsing
         # (JavaScript numbers come back as floats, but Polars Int64 needs int comparison)
@@ -246,12 +252,39 @@ def _filter_and_collect(
     df_polars = data.collect()
 
     # Compute hash efficiently (no pickle)
-    data_hash = compute_dataframe_hash(df_polars)
+    return (df_polars, compute_dataframe_hash(df_polars))
 
-    # Convert to pandas for Arrow serialization (zero-copy when possible)
-    df_pandas = df_polars.to_pandas()
 
-    return (df_pandas, data_hash)
+def _filter_and_collect(
+    data: pl.LazyFrame,
+    filters_tuple: Tuple[Tuple[str, str], ...],
+    state_tuple: Tuple[Tuple[str, Any], ...],
+    columns_tuple: Optional[Tuple[str, ...]] = None,
+) -> Tuple["pd.DataFrame", str]:
+    """
+    Filter data and collect.
+
+    This function executes the filter query. Caching is handled at a higher
+    level (per-component in bridge.py) to ensure memory = O(num_components).
+
+    Returns pandas DataFrame for efficient Arrow serialization to frontend.
+
+    Args:
+        data: LazyFrame to filter
+        filters_tuple: Tuple of (identifier, column) pairs from filters dict
+        state_tuple: Tuple of (identifier, value) pairs for current selection state
+            (already has defaults applied from _make_cache_key)
+        columns_tuple: Optional tuple of column names to select (projection)
+
+    Returns:
+        Tuple of (pandas DataFrame, hash string)
+    """
+    df_polars, data_hash = _filter_and_collect_polars(
+        data, filters_tuple, state_tuple, columns_tuple
+    )
+
+    # Convert to pandas for Arrow serialization (zero-copy when possible)
+    return (df_polars.to_pandas(), data_hash)
 
 
 def filter_and_collect_cached(
@@ -260,7 +293,7 @@ def filter_and_collect_cached(
     state: Dict[str, Any],
     columns: Optional[List[str]] = None,
     filter_defaults: Optional[Dict[str, Any]] = None,
-) -> Tuple[pd.DataFrame, str]:
+) -> Tuple["pd.DataFrame", str]:
     """
     Filter data based on selection state and collect, with caching.
 
@@ -301,6 +334,42 @@ def filter_and_collect_cached(
     )
 
 
+def filter_and_collect_polars(
+    data: Union[pl.LazyFrame, pl.DataFrame],
+    filters: Dict[str, str],
+    state: Dict[str, Any],
+    columns: Optional[List[str]] = None,
+    filter_defaults: Optional[Dict[str, Any]] = None,
+) -> Tuple[pl.DataFrame, str]:
+    """
+    Filter data based on selection state and collect as a Polars DataFrame.
+
+    Same semantics as filter_and_collect_cached, but returns the collected
+    Polars DataFrame instead of converting it to pandas. Use this when the
+    result is processed further in Polars (e.g., downsampled or sorted)
+    before being sent to the frontend.
+
+    Args:
+        data: The data to filter (LazyFrame or DataFrame)
+        filters: Mapping of identifier names to column names for filtering
+        state: Current selection state with identifier values
+        columns: Optional list of column names to select (projection pushdown)
+        filter_defaults: Optional default values for filters when state is None
+
+    Returns:
+        Tuple of (Polars DataFrame, hash string) with filters and projection applied
+    """
+    if isinstance(data, pl.DataFrame):
+        data = data.lazy()
+
+    return _filter_and_collect_polars(
+        data,
+        tuple(sorted(filters.items())),
+        _make_cache_key(filters, state, filter_defaults),
+        tuple(columns) if columns else None,
+    )
+
+
 def filter_by_selection(
     data: Union[pl.LazyFrame, pl.DataFrame],
     interactivity: Dict[str, str],
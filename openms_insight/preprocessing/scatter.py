@@ -1,10 +1,12 @@
 """Shared utilities for scatter-based components (Heatmap, VolcanoPlot)."""
 
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-import pandas as pd
 import polars as pl
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 from .filtering import compute_dataframe_hash, filter_and_collect_cached
 
 
@@ -68,7 +70,7 @@ def prepare_scatter_data(
     extra_columns: Optional[List[str]] = None,
     sort_by_value: bool = True,
     sort_ascending: bool = True,
-) -> Tuple[pd.DataFrame, str]:
+) -> Tuple["pd.DataFrame", str]:
     """
     Prepare scatter data for Vue component.
 
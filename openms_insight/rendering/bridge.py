@@ -249,6 +249,16 @@ def _prepare_vue_data_cached(
     # Try cache first (works for ALL components now)
     cached = _get_cached_vue_data(component_id, filter_state_hashable)
 
+    # A peak-limited LinePlot keeps annotated peaks, so its base data depends on
+    # which peaks are annotated: recompute when the annotated ids change
+    if (
+        cached is not None
+        and has_dynamic_annotations
+        and getattr(component, "_max_points", None) is not None
+        and cached[2] != _compute_annotation_hash(component)
+    ):
+        cached = None
+
     if _DEBUG_HASH_TRACKING:
         cache_hit = cached is not None
         _logger.warning(f"[CacheDebug] {component._cache_id}: cache_hit={cache_hit}")
@@ -561,8 +571,26 @@ def render_component(
                 f"cached_ann={cached_ann_hash}, current_ann={current_ann_hash}"
             )
 
+    # Vue echoes the hash of the data it currently holds. If that matches the
+    # cached payload and the payload is nothing but dataframes (no navigation
+    # hints or config riding along), skip re-serializing it to Arrow entirely.
+    vue_has_data = (
+        cache_valid
+        and bool(cached_hash)
+        and st.session_state[_VUE_ECHOED_HASH_KEY].get(key) == cached_hash
+        and all(isinstance(v, pd.DataFrame) for v in cached_data.values())
+    )
+
     # Build payload - only send data if cache is valid for current state
-    if cache_valid:
+    if vue_has_data:
+        # Vue already renders this exact data - send hash and state only
+        data_payload = {
+            "selection_store": initial_state,
+            "hash": cached_hash,
+            "dataChanged": False,
+            "awaitingFilter": False,
+        }
+    elif cache_valid:
         # Cache HIT - send cached data (it's correct for current state)
         data_payload = {
             **cached_data,
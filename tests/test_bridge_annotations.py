@@ -175,3 +175,31 @@ def test_prepare_vue_data_cached_includes_plot_config_when_annotations_cleared()
         assert plot_config["highlightColumn"] is None, (
             "highlightColumn should be None when annotations cleared"
         )
+
+
+def test_peak_limited_lineplot_recomputed_when_annotations_change(
+    mock_streamlit, temp_cache_dir, sample_lineplot_data
+):
+    """A new annotated peak is sent even if the cached base data dropped it."""
+    from openms_insight import LinePlot
+    from openms_insight.rendering.bridge import _prepare_vue_data_cached
+
+    plot = LinePlot(
+        cache_id="test_bridge_max_points",
+        data=sample_lineplot_data,
+        interactivity={"peak": "peak_id"},
+        x_column="mass",
+        y_column="intensity",
+        cache_path=str(temp_cache_dir),
+        max_points=2,
+    )
+    component_id = "LinePlot:test_bridge_max_points"
+
+    plot.set_dynamic_annotations({50: {"highlight": True, "annotation": "b4"}})
+    first, _ = _prepare_vue_data_cached(plot, component_id, (), {})
+    assert 100.0 not in first["plotData"]["mass"].tolist()
+
+    plot.set_dynamic_annotations({10: {"highlight": True, "annotation": "b1"}})
+    second, _ = _prepare_vue_data_cached(plot, component_id, (), {})
+    df = second["plotData"]
+    assert df.loc[df["mass"] == 100.0, "_dynamic_annotation"].tolist() == ["b1"]
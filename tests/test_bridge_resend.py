@@ -0,0 +1,73 @@
+"""Tests for skipping data resends when Vue already holds the payload."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from openms_insight import Heatmap
+from openms_insight.core.state import StateManager
+from openms_insight.rendering.bridge import render_component
+
+
+@pytest.fixture
+def heatmap(mock_streamlit, temp_cache_dir, sample_heatmap_data) -> Heatmap:
+    """Small unfiltered heatmap."""
+    return Heatmap(
+        cache_id="test_bridge_resend",
+        data=sample_heatmap_data,
+        cache_path=str(temp_cache_dir),
+        x_column="retention_time",
+        y_column="mz",
+        intensity_column="intensity",
+        min_points=100,
+    )
+
+
+@pytest.fixture
+def vue_func():
+    """Mock Vue component function; rerun is patched out."""
+    func = Mock(return_value=None)
+    with patch("streamlit.rerun", Mock()):
+        with patch(
+            "openms_insight.rendering.bridge.get_vue_component_function",
+            return_value=func,
+        ):
+            yield func
+
+
+def _render(heatmap, state_manager, vue_func, vue_hash=None):
+    """Render once, with Vue echoing vue_hash, and return the sent kwargs."""
+    vue_func.return_value = (
+        {"_vueDataHash": vue_hash, "id": state_manager.get_state_for_vue()["id"]}
+        if vue_hash is not None
+        else None
+    )
+    render_component(heatmap, state_manager, key="resend")
+    return vue_func.call_args.kwargs
+
+
+class TestDataResend:
+    """Tests for the bidirectional hash check in render_component."""
+
+    def test_data_sent_until_vue_confirms_hash(self, heatmap, vue_func):
+        """Cached data is sent while Vue has not echoed its hash."""
+        state_manager = StateManager(session_key="resend_state")
+        _render(heatmap, state_manager, vue_func)  # populates the cache
+
+        sent = _render(heatmap, state_manager, vue_func)
+        assert sent["dataChanged"] is True
+        assert "heatmapData" in sent
+
+    def test_data_skipped_once_vue_has_it(self, heatmap, vue_func):
+        """After Vue echoes the current hash, only hash and state are sent."""
+        state_manager = StateManager(session_key="resend_state")
+        _render(heatmap, state_manager, vue_func)
+        sent = _render(heatmap, state_manager, vue_func)
+        data_hash = sent["hash"]
+
+        _render(heatmap, state_manager, vue_func, vue_hash=data_hash)
+        sent = _render(heatmap, state_manager, vue_func, vue_hash=data_hash)
+
+        assert sent["dataChanged"] is False
+        assert sent["hash"] == data_hash
+        assert "heatmapData" not in sent
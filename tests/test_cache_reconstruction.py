@@ -903,3 +903,31 @@ class TestFilterAndInteractivityRestoration:
         )
 
         assert reconstructed.get_filter_defaults() == filter_defaults
+
+
+class TestJsonValueProbe:
+    """Tests for the manifest value serializability check."""
+
+    def test_matches_json_dumps(self):
+        """The type walk accepts exactly what json.dumps accepts."""
+        import json
+        from datetime import date
+
+        from openms_insight.core.base import _is_json_like
+
+        values = [
+            {"a": [1, 2.5, None, True], "b": {"c": "x"}},
+            [{"field": "mass", "sorter": "number"}],
+            (1, "two"),
+            {1: "int keys are allowed"},
+            {"when": date(2024, 1, 1)},
+            [object()],
+            {("tuple", "key"): 1},
+        ]
+        for value in values:
+            try:
+                json.dumps(value)
+                expected = True
+            except (TypeError, ValueError):
+                expected = False
+            assert _is_json_like(value) is expected, value
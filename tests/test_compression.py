@@ -2,9 +2,15 @@
 Tests for compression.py downsampling functions.
 """
 
+import numpy as np
 import polars as pl
 
+from openms_insight.preprocessing import compression
 from openms_insight.preprocessing.compression import (
+    collect_streaming,
+    compute_bin_counts_2d,
+    compute_bin_indices_2d,
+    downsample_2d,
     downsample_2d_simple,
     downsample_2d_streaming,
 )
@@ -141,3 +147,169 @@ class TestDownsampleDescendingParameter:
         assert 500.0 in intensities
         assert 400.0 in intensities
         assert 300.0 in intensities
+
+
+class TestBinIndices2D:
+    """Test vectorized uniform 2D bin index computation."""
+
+    def test_matches_histogram2d(self):
+        """Per-bin counts match numpy.histogram2d on the data range."""
+        rng = np.random.default_rng(0)
+        x = rng.uniform(0, 100, 5000)
+        y = rng.uniform(-5, 5, 5000)
+
+        x_bin, y_bin = compute_bin_indices_2d(x, y, 20, 8)
+        counts = np.bincount(x_bin * 8 + y_bin, minlength=160).reshape(20, 8)
+        expected, _, _ = np.histogram2d(x, y, bins=[20, 8])
+
+        np.testing.assert_array_equal(counts, expected)
+
+    def test_max_value_in_last_bin(self):
+        """Points on the upper edge fall into the last bin."""
+        x_bin, y_bin = compute_bin_indices_2d(
+            np.array([0.0, 10.0]), np.array([0.0, 10.0]), 4, 4
+        )
+        assert x_bin.tolist() == [0, 3]
+        assert y_bin.tolist() == [0, 3]
+
+    def test_degenerate_axis(self):
+        """A constant axis does not divide by zero."""
+        x_bin, y_bin = compute_bin_indices_2d(
+            np.array([1.0, 2.0]), np.array([5.0, 5.0]), 2, 3
+        )
+        assert y_bin.tolist() == [1, 1]
+
+
+class TestBinCounts2D:
+    """Test fused bin index + count computation."""
+
+    def test_counts_match_indices(self):
+        """Counts agree with the returned per-point bin indices."""
+        rng = np.random.default_rng(1)
+        x = rng.uniform(0, 10, 2000)
+        y = rng.uniform(0, 10, 2000)
+
+        x_bin, y_bin, counts = compute_bin_counts_2d(x, y, 7, 5)
+
+        assert counts.shape == (35,)
+        assert counts.sum() == 2000
+        np.testing.assert_array_equal(
+            counts, np.bincount(x_bin * 5 + y_bin, minlength=35)
+        )
+
+    def test_numpy_fallback(self, monkeypatch):
+        """Without numba the NumPy path produces histogram2d counts."""
+        monkeypatch.setattr(compression, "HAS_NUMBA", False)
+        rng = np.random.default_rng(2)
+        x = rng.uniform(0, 1, 500)
+        y = rng.uniform(0, 1, 500)
+
+        _, _, counts = compute_bin_counts_2d(x, y, 4, 4)
+        expected, _, _ = np.histogram2d(x, y, bins=[4, 4])
+
+        np.testing.assert_array_equal(counts.reshape(4, 4), expected)
+
+
+class TestDownsample2D:
+    """Test binned top-N downsampling."""
+
+    def test_keeps_highest_point_per_bin(self):
+        """With one point per bin budget, the highest point of each bin wins."""
+        data = pl.LazyFrame(
+            {
+                "x": [0.0, 0.1, 9.9, 10.0],
+                "y": [0.0, 0.1, 9.9, 10.0],
+                "intensity": [1.0, 5.0, 7.0, 3.0],
+            }
+        )
+        result = downsample_2d(data, max_points=3, x_bins=2, y_bins=1).collect()
+
+        assert sorted(result["intensity"].to_list()) == [5.0, 7.0]
+
+    def test_small_data_unchanged(self):
+        """Data below max_points is returned unchanged."""
+        data = pl.LazyFrame({"x": [1.0, 2.0], "y": [1.0, 2.0], "intensity": [1.0, 2.0]})
+        result = downsample_2d(data, max_points=10, x_bins=2, y_bins=2).collect()
+        assert len(result) == 2
+
+
+class TestLinearBinId:
+    """Test the flattened bin id used as the single group_by key."""
+
+    def test_matches_two_key_binning(self):
+        """The linear id equals x_bin * y_bins + y_bin for a fixed range."""
+        data = pl.DataFrame(
+            {"x": [0.0, 4.9, 6.0, 10.0], "y": [0.0, 9.9, 1.0, 10.0]},
+        )
+        result = data.select(
+            compression._linear_bin_expr("x", "y", 2, 4, (0.0, 10.0), (0.0, 10.0))
+        )
+        # x bins: [0,5) -> 0, [5,10] -> 1; y bins of width 2.5
+        assert result["_bin"].to_list() == [0, 3, 4, 7]
+        assert result.schema["_bin"] == pl.UInt32
+
+    def test_data_range_matches_explicit_range(self):
+        """Without explicit ranges the id uses the frame's own extent."""
+        data = pl.DataFrame(
+            {"x": [2.0, 4.9, 7.5, 12.0], "y": [1.0, 3.0, 8.0, 11.0]},
+        )
+        implicit = data.select(compression._linear_bin_expr("x", "y", 4, 3))
+        explicit = data.select(
+            compression._linear_bin_expr("x", "y", 4, 3, (2.0, 12.0), (1.0, 11.0))
+        )
+        assert implicit["_bin"].to_list() == explicit["_bin"].to_list()
+
+    def test_streaming_keeps_points_per_bin(self):
+        """Each bin keeps at most max_points // bins of its top points."""
+        rng = np.random.default_rng(4)
+        data = pl.LazyFrame(
+            {
+                "x": rng.uniform(0, 1, 1000),
+                "y": rng.uniform(0, 1, 1000),
+                "intensity": rng.uniform(0, 1, 1000),
+            }
+        )
+        result = downsample_2d_streaming(
+            data, max_points=32, x_bins=4, y_bins=4, x_range=(0, 1), y_range=(0, 1)
+        ).collect()
+
+        per_bin = (
+            result.with_columns(
+                compression._linear_bin_expr("x", "y", 4, 4, (0, 1), (0, 1))
+            )
+            .group_by("_bin")
+            .len()
+        )
+        assert len(result) == 32
+        assert per_bin["len"].max() == 2
+
+
+class TestCollectStreaming:
+    """Tests for the streaming collect used during preprocessing."""
+
+    def test_matches_in_memory_collect(self):
+        """Streaming and in-memory engines return the same result."""
+        data = pl.LazyFrame({"x": [3.0, 1.0, 2.0], "y": [1, 2, 3]})
+        query = data.filter(pl.col("y") > 1).sort("x")
+        assert collect_streaming(query).equals(query.collect())
+
+    def test_falls_back_without_engine_argument(self):
+        """Polars releases without the engine argument collect in memory."""
+
+        class LegacyLazyFrame:
+            def collect(self):
+                return pl.DataFrame({"x": [1]})
+
+        assert collect_streaming(LegacyLazyFrame()).equals(pl.DataFrame({"x": [1]}))
+
+    def test_falls_back_on_unknown_engine_name(self):
+        """Polars 1.x before the "streaming" engine name collect in memory."""
+
+        class EarlyEngineLazyFrame:
+            def collect(self, engine="cpu"):
+                if engine not in ("cpu", "gpu"):
+                    raise ValueError(f"Invalid engine argument {engine!r}")
+                return pl.DataFrame({"x": [1]})
+
+        result = collect_streaming(EarlyEngineLazyFrame())
+        assert result.equals(pl.DataFrame({"x": [1]}))
@@ -0,0 +1,530 @@
+"""Tests for Heatmap zoom-level selection."""
+
+import numpy as np
+import polars as pl
+import pytest
+
+from openms_insight import Heatmap
+
+
+@pytest.fixture
+def heatmap(mock_streamlit, temp_cache_dir, sample_heatmap_data) -> Heatmap:
+    """Streaming heatmap with two levels (200-point cache level + full)."""
+    return Heatmap(
+        cache_id="test_level_selection",
+        data=sample_heatmap_data,
+        cache_path=str(temp_cache_dir),
+        x_column="retention_time",
+        y_column="mz",
+        intensity_column="intensity",
+        min_points=100,
+    )
+
+
+class TestLevelCounts:
+    """Tests for per-level row counts recorded at preprocessing time."""
+
+    def test_counts_recorded_for_each_level(self, heatmap):
+        """Each level has a row count; the last one is the full dataset."""
+        counts = heatmap._preprocessed_data["level_counts"]
+        assert len(counts) == heatmap._preprocessed_data["num_levels"]
+        assert counts[-1] == 1000
+        assert counts == sorted(counts)
+
+    def test_counts_survive_reconstruction(self, heatmap, temp_cache_dir):
+        """Counts are restored from the manifest in reconstruction mode."""
+        restored = Heatmap(
+            cache_id="test_level_selection", cache_path=str(temp_cache_dir)
+        )
+        assert (
+            restored._preprocessed_data["level_counts"]
+            == heatmap._preprocessed_data["level_counts"]
+        )
+
+    def test_counts_computed_when_missing(self, heatmap):
+        """Caches without recorded counts fall back to parquet metadata."""
+        heatmap._preprocessed_data.pop("level_counts")
+        levels = heatmap._get_levels()
+        counts = heatmap._get_level_counts("level_counts", levels)
+        assert counts[-1] == 1000
+
+
+class TestLevelSkipping:
+    """Tests that undersized levels are skipped without collection."""
+
+    def test_small_level_is_not_collected(self, heatmap):
+        """A level with fewer than min_points rows in total is never collected."""
+        unreadable = pl.LazyFrame({"other": [1.0]}).select(pl.col("missing"))
+        full = heatmap._get_levels()[-1]
+        zoom = {"xRange": [0, 100], "yRange": [100, 2000]}
+
+        result = heatmap._select_level_for_zoom(
+            zoom, {}, [unreadable, full], None, {}, level_counts=[10, 1000]
+        )
+        assert 0 < len(result) <= heatmap._min_points
+
+    def test_largest_level_is_always_evaluated(self, heatmap):
+        """The largest level is used even when its total is below min_points."""
+        small = pl.LazyFrame(
+            {"retention_time": [1.0], "mz": [150.0], "intensity": [5.0]}
+        )
+        zoom = {"xRange": [0, 100], "yRange": [100, 2000]}
+
+        result = heatmap._select_level_for_zoom(
+            zoom, {}, [small], None, {}, level_counts=[1]
+        )
+        assert len(result) == 1
+
+
+class TestLevelDtypes:
+    """Tests for the storage dtypes of cascaded levels."""
+
+    def test_float_columns_stored_as_float32(self, heatmap):
+        """Streaming levels are written with Float64 downcast to Float32."""
+        for level in heatmap._get_levels():
+            schema = level.collect_schema()
+            assert schema["retention_time"] == pl.Float32
+            assert schema["mz"] == pl.Float32
+            assert schema["intensity"] == pl.Float32
+
+
+class TestLevelMaterialization:
+    """Tests for in-memory materialization of compressed levels."""
+
+    def test_compressed_levels_materialized(self, heatmap):
+        """Compressed levels are DataFrames; full resolution stays lazy."""
+        levels, _, _ = heatmap._get_levels_for_state({})
+        assert all(isinstance(lvl, pl.DataFrame) for lvl in levels[:-1])
+        assert isinstance(levels[-1], pl.LazyFrame)
+
+    def test_materialized_levels_shared_across_instances(self, heatmap, temp_cache_dir):
+        """A reconstructed instance reuses the already collected level."""
+        levels, _, _ = heatmap._get_levels_for_state({})
+        restored = Heatmap(
+            cache_id="test_level_selection", cache_path=str(temp_cache_dir)
+        )
+        restored_levels, _, _ = restored._get_levels_for_state({})
+        assert restored_levels[0] is levels[0]
+
+    def test_level_over_byte_budget_not_kept(
+        self, mock_streamlit, temp_cache_dir, sample_heatmap_data, monkeypatch
+    ):
+        """A level larger than the byte budget is returned but not cached."""
+        from openms_insight.components import heatmap as heatmap_module
+
+        monkeypatch.setattr(heatmap_module, "_LEVEL_CACHE_MAX_BYTES", 1)
+        heatmap = Heatmap(
+            cache_id="test_level_byte_budget",
+            data=sample_heatmap_data,
+            cache_path=str(temp_cache_dir),
+            x_column="retention_time",
+            y_column="mz",
+            intensity_column="intensity",
+            min_points=100,
+        )
+        levels, _, _ = heatmap._get_levels_for_state({})
+
+        assert isinstance(levels[0], pl.DataFrame)
+        token = heatmap._get_cache_token()
+        assert not any(key[0] == token for key in heatmap_module._level_cache)
+        assert set(heatmap_module._level_cache_sizes) == set(
+            heatmap_module._level_cache
+        )
+
+
+class TestLevelsMemo:
+    """Tests for memoizing level lists on the instance."""
+
+    def test_levels_built_once(self, heatmap):
+        """Repeated calls return the same list and tuple objects."""
+        assert heatmap._get_levels() is heatmap._get_levels()
+        assert heatmap._get_levels_for_state({}) is heatmap._get_levels_for_state({})
+
+    def test_memo_reset_when_preprocessed_data_replaced(self, heatmap):
+        """Reloading the cache replaces the data dict and drops the memo."""
+        before = heatmap._get_levels()
+        heatmap._load_from_cache()
+        after = heatmap._get_levels()
+        assert after is not before
+        assert len(after) == len(before)
+
+
+class TestZoomRangeFilter:
+    """Tests for restricting levels to the zoom rectangle."""
+
+    @pytest.mark.parametrize("mark_sorted", [True, False])
+    def test_matches_plain_filter(self, heatmap, mark_sorted):
+        """Binary-search slicing returns exactly the rows of a plain filter."""
+        level = heatmap._get_levels()[-1].collect().sort(["retention_time", "mz"])
+        if mark_sorted:
+            level = level.with_columns(pl.col("retention_time").set_sorted())
+
+        result = heatmap._filter_zoom_range(level, 20.5, 60.25, 300, 1500).collect()
+        expected = level.filter(
+            pl.col("retention_time").is_between(20.5, 60.25)
+            & pl.col("mz").is_between(300, 1500)
+        )
+        assert result.equals(expected)
+
+    def test_empty_window(self, heatmap):
+        """A window outside the data yields no rows."""
+        level = heatmap._get_levels_for_state({})[0][0]
+        result = heatmap._filter_zoom_range(level, 500, 600, 0, 1).collect()
+        assert len(result) == 0
+
+
+class TestCompleteLevelShortCircuit:
+    """Tests for stopping at a level that already holds all data."""
+
+    def test_stops_at_complete_level(self, heatmap):
+        """Larger levels are not touched once a level holds every row."""
+        full = heatmap._get_levels()[-1].collect()
+        unreadable = pl.LazyFrame({"other": [1.0]}).select(pl.col("missing"))
+        zoom = {"xRange": [0, 1], "yRange": [100, 200]}
+
+        result = heatmap._select_level_for_zoom(
+            zoom, {}, [full, unreadable], None, {}, level_counts=[1000, 1000]
+        )
+        assert len(result) < heatmap._min_points
+
+
+class TestFilteredLevelCache:
+    """Tests for memoizing render-time filters on in-memory levels."""
+
+    @pytest.fixture
+    def heatmap(self, mock_streamlit, temp_cache_dir, sample_heatmap_data):
+        """Heatmap with a render-time scan_id filter."""
+        return Heatmap(
+            cache_id="test_filtered_level_cache",
+            data=sample_heatmap_data,
+            cache_path=str(temp_cache_dir),
+            x_column="retention_time",
+            y_column="mz",
+            intensity_column="intensity",
+            filters={"spectrum": "scan_id"},
+            min_points=100,
+        )
+
+    def test_filtered_level_is_reused(self, heatmap, monkeypatch):
+        """The same level and filter state is filtered only once."""
+        from openms_insight.components import heatmap as heatmap_module
+
+        level = heatmap._get_levels()[-1].collect().sort("retention_time")
+        level = level.with_columns(pl.col("retention_time").set_sorted())
+        filters = {"spectrum": "scan_id"}
+
+        first = heatmap._get_filtered_level(level, filters, {"spectrum": 3})
+        monkeypatch.setattr(heatmap_module, "filter_and_collect_polars", None)
+        second = heatmap._get_filtered_level(level, filters, {"spectrum": 3})
+
+        assert second is first
+        assert first["scan_id"].unique().to_list() == [3]
+        assert first["retention_time"].flags["SORTED_ASC"]
+
+    def test_zoom_on_filtered_level_matches_lazy_path(self, heatmap):
+        """Filter-then-zoom on memory matches zoom-then-filter on a scan."""
+        lazy = heatmap._get_levels()[-1]
+        level = lazy.collect().sort("retention_time")
+        level = level.with_columns(pl.col("retention_time").set_sorted())
+        zoom = {"xRange": [10, 70], "yRange": [200, 1800]}
+        filters = {"spectrum": "scan_id"}
+
+        in_memory = heatmap._select_level_for_zoom(
+            zoom, {"spectrum": 5}, [level], None, filters
+        )
+        scanned = heatmap._select_level_for_zoom(
+            zoom, {"spectrum": 5}, [lazy], None, filters
+        )
+        assert in_memory.sort(["retention_time", "mz"]).equals(
+            scanned.sort(["retention_time", "mz"])
+        )
+
+    def test_filtered_level_is_projected(self, heatmap):
+        """Columns outside the projection are dropped before filtering."""
+        level = (
+            heatmap._get_levels()[-1].collect().with_columns(pl.lit(0).alias("unused"))
+        )
+        columns = ["retention_time", "mz", "scan_id", "not_in_level"]
+
+        filtered = heatmap._get_filtered_level(
+            level, {"spectrum": "scan_id"}, {"spectrum": 3}, columns
+        )
+        assert filtered.columns == ["retention_time", "mz", "scan_id"]
+        assert filtered["scan_id"].unique().to_list() == [3]
+
+    def test_byte_budget_evicts_oldest(self, heatmap, monkeypatch):
+        """Entries are evicted oldest first once the byte budget is exceeded."""
+        from openms_insight.components import heatmap as heatmap_module
+
+        level = heatmap._get_levels()[-1].collect()
+        filters = {"spectrum": "scan_id"}
+        heatmap._get_filtered_level(level, filters, {"spectrum": 1})
+        # Room for one entry (level plus a subset of it), not two
+        budget = 2 * level.estimated_size()
+        monkeypatch.setattr(heatmap_module, "_FILTERED_LEVEL_CACHE_MAX_BYTES", budget)
+
+        heatmap._get_filtered_level(level, filters, {"spectrum": 2})
+
+        cache = heatmap_module._filtered_level_cache
+        held = [key for key, entry in cache.items() if entry[0] is level]
+        assert len(held) == 1
+        assert cache[held[0]][1]["scan_id"].unique().to_list() == [2]
+        assert sum(heatmap_module._filtered_level_cache_sizes.values()) <= budget
+
+
+class TestColumnProjection:
+    """Tests for dropping columns the Vue component never receives."""
+
+    def test_levels_hold_only_needed_columns(self, heatmap):
+        """Unmapped source columns are not written to level files."""
+        for level in heatmap._get_levels():
+            assert level.collect_schema().names() == [
+                "retention_time",
+                "mz",
+                "intensity",
+            ]
+
+    def test_column_list_built_once(self, heatmap):
+        """The projection list is memoized on the instance."""
+        assert heatmap._get_columns_to_select() is heatmap._get_columns_to_select()
+
+    def test_zoom_range_projects_columns(self, heatmap):
+        """Requested columns are applied to the plan; unknown ones are ignored."""
+        level = heatmap._get_levels()[-1]
+        result = heatmap._filter_zoom_range(
+            level, 0, 100, 0, 5000, columns=["mz", "retention_time", "absent"]
+        ).collect()
+        assert result.columns == ["mz", "retention_time"]
+
+    def test_missing_category_column_is_skipped(
+        self, mock_streamlit, temp_cache_dir, sample_heatmap_data
+    ):
+        """A category_column absent from the data does not break preprocessing."""
+        heatmap = Heatmap(
+            cache_id="test_missing_category",
+            data=sample_heatmap_data,
+            cache_path=str(temp_cache_dir),
+            x_column="retention_time",
+            y_column="mz",
+            intensity_column="intensity",
+            category_column="absent",
+            min_points=100,
+        )
+        payload = heatmap._prepare_vue_data({})
+        data = payload[heatmap._get_data_key()]
+        assert len(data) > 0
+        assert "absent" not in data.columns
+
+
+class TestLogIntensity:
+    """Tests for the log10 intensity added to payloads for coloring."""
+
+    def test_log_intensity_in_payload_not_levels(self, heatmap):
+        """The payload carries Float32 log10(intensity); level files do not."""
+        payload = heatmap._prepare_vue_data({})["heatmapData"]
+        expected = np.log10(payload["intensity"].to_numpy(dtype=np.float64))
+        assert payload["_log_intensity"].dtype == np.float32
+        assert np.abs(payload["_log_intensity"].to_numpy() - expected).max() < 1e-5
+        assert heatmap._get_component_args()["logIntensityColumn"] == "_log_intensity"
+        for level in heatmap._get_levels():
+            assert "_log_intensity" not in level.collect_schema().names()
+
+    @pytest.mark.parametrize(
+        "options",
+        [{"log_scale": False}, {"category_column": "scan_id"}],
+    )
+    def test_not_sent_when_unused(
+        self, mock_streamlit, temp_cache_dir, sample_heatmap_data, options
+    ):
+        """Linear scale and categorical coloring never read the column."""
+        heatmap = Heatmap(
+            cache_id=f"test_log_intensity_{'_'.join(options)}",
+            data=sample_heatmap_data,
+            cache_path=str(temp_cache_dir),
+            x_column="retention_time",
+            y_column="mz",
+            intensity_column="intensity",
+            min_points=100,
+            **options,
+        )
+        payload = heatmap._prepare_vue_data({})["heatmapData"]
+        assert "_log_intensity" not in payload.columns
+        assert "logIntensityColumn" not in heatmap._get_component_args()
+
+
+class TestLevelRowGroups:
+    """Tests for writing levels as small x-sorted row groups (tiles)."""
+
+    def test_levels_written_in_small_row_groups(self, mock_streamlit, temp_cache_dir):
+        """Each row group holds at most the heatmap row group size."""
+        import numpy as np
+        import pyarrow.parquet as pq
+
+        rng = np.random.default_rng(3)
+        n = 25_000
+        tiled = Heatmap(
+            cache_id="test_row_groups",
+            data=pl.LazyFrame(
+                {
+                    "x": rng.uniform(0, 100, n),
+                    "y": rng.uniform(0, 100, n),
+                    "intensity": rng.uniform(1, 10, n),
+                }
+            ),
+            cache_path=str(temp_cache_dir),
+            x_column="x",
+            y_column="y",
+            intensity_column="intensity",
+            min_points=100,
+        )
+        num_levels = tiled._preprocessed_data["num_levels"]
+        path = tiled._get_preprocessed_dir() / f"level_{num_levels - 1}.parquet"
+        metadata = pq.ParquetFile(path).metadata
+
+        assert metadata.num_row_groups >= 3
+        sizes = [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+        assert max(sizes) <= tiled._get_row_group_size()
+
+
+class TestCountProbe:
+    """Tests for probing on-disk levels with count queries."""
+
+    def test_insufficient_lazy_level_not_collected(self, heatmap, monkeypatch):
+        """A lazy level below min_points in the window is counted, not collected."""
+        levels = heatmap._get_levels()
+        collected = []
+        original = pl.LazyFrame.collect
+
+        def tracking_collect(self, *args, **kwargs):
+            result = original(self, *args, **kwargs)
+            collected.append(result.columns)
+            return result
+
+        monkeypatch.setattr(pl.LazyFrame, "collect", tracking_collect)
+        zoom = {"xRange": [0, 30], "yRange": [100, 2000]}
+        result = heatmap._select_level_for_zoom(
+            zoom, {}, levels, None, {}, level_counts=[heatmap._min_points, 1000]
+        )
+
+        # Level 0 only answers a count query; level 1 is the one collected
+        assert collected[0] == ["len"]
+        assert 0 < len(result) <= heatmap._min_points
+
+    def test_insufficient_memory_level_not_collected(self, heatmap, monkeypatch):
+        """In-memory levels are probed with a count query as well."""
+        levels = heatmap._get_levels()
+        small = levels[0].collect()
+        collected = []
+        original = pl.LazyFrame.collect
+
+        def tracking_collect(self, *args, **kwargs):
+            result = original(self, *args, **kwargs)
+            collected.append(result.columns)
+            return result
+
+        monkeypatch.setattr(pl.LazyFrame, "collect", tracking_collect)
+        zoom = {"xRange": [0, 30], "yRange": [100, 2000]}
+        heatmap._select_level_for_zoom(
+            zoom,
+            {},
+            [small, levels[1]],
+            None,
+            {},
+            level_counts=[heatmap._min_points, 1000],
+        )
+
+        assert collected[0] == ["len"]
+
+
+class TestCategoricalLevels:
+    """Tests for per-value levels built concurrently for categorical filters."""
+
+    def test_each_value_gets_its_own_levels(
+        self, mock_streamlit, temp_cache_dir, sample_heatmap_data
+    ):
+        """Every filter value has complete levels holding only its rows."""
+        heatmap = Heatmap(
+            cache_id="test_categorical_levels",
+            data=sample_heatmap_data,
+            cache_path=str(temp_cache_dir),
+            x_column="retention_time",
+            y_column="mz",
+            intensity_column="intensity",
+            filters={"spectrum": "scan_id"},
+            categorical_filters=["spectrum"],
+            min_points=10,
+        )
+        expected = (
+            sample_heatmap_data.group_by("scan_id").len().collect().sort("scan_id")
+        )
+        values = heatmap._preprocessed_data["categorical_filter_values"]["spectrum"]
+        assert values == expected["scan_id"].to_list()
+
+        for value, total in zip(values, expected["len"].to_list()):
+            num_levels = heatmap._preprocessed_data[f"cat_num_levels_spectrum_{value}"]
+            counts = heatmap._preprocessed_data[f"cat_level_counts_spectrum_{value}"]
+            assert len(counts) == num_levels
+            assert counts[-1] == total
+
+            full = heatmap._preprocessed_data[
+                f"cat_level_spectrum_{value}_{num_levels - 1}"
+            ].collect()
+            assert full["scan_id"].unique().to_list() == [value]
+
+
+class TestPolarsFilterCollect:
+    """Tests for collecting render-time filters straight to Polars."""
+
+    def test_matches_pandas_variant(self, sample_heatmap_data):
+        """filter_and_collect_polars returns the same rows and hash."""
+        from openms_insight.preprocessing.filtering import (
+            filter_and_collect_cached,
+            filter_and_collect_polars,
+        )
+
+        filters = {"spectrum": "scan_id"}
+        columns = ["retention_time", "scan_id"]
+        df_polars, polars_hash = filter_and_collect_polars(
+            sample_heatmap_data, filters, {"spectrum": 3}, columns=columns
+        )
+        df_pandas, pandas_hash = filter_and_collect_cached(
+            sample_heatmap_data, filters, {"spectrum": 3}, columns=columns
+        )
+
+        assert isinstance(df_polars, pl.DataFrame)
+        assert df_polars.columns == columns
+        assert df_polars.equals(pl.from_pandas(df_pandas))
+        assert polars_hash == pandas_hash
+
+    def test_missing_selection_returns_empty(self, sample_heatmap_data):
+        """A filter without selection or default yields an empty frame."""
+        from openms_insight.preprocessing.filtering import filter_and_collect_polars
+
+        df, _ = filter_and_collect_polars(
+            sample_heatmap_data, {"spectrum": "scan_id"}, {}
+        )
+        assert len(df) == 0
+        assert "scan_id" in df.columns
+
+
+class TestDataRangeEarlyOut:
+    """Tests for skipping level selection outside the data extent."""
+
+    def test_window_outside_data_reads_no_level(self, heatmap):
+        """A zoom beyond the recorded x/y range never touches the levels."""
+        first = heatmap._get_levels()[-1].collect()
+        unreadable = pl.LazyFrame({"other": [1.0]}).select(pl.col("missing"))
+        x_max = heatmap._preprocessed_data["x_range"][1]
+        zoom = {"xRange": [x_max + 10, x_max + 20], "yRange": [100, 2000]}
+
+        result = heatmap._select_level_for_zoom(
+            zoom, {}, [first, unreadable], None, {}, columns=["retention_time", "mz"]
+        )
+        assert len(result) == 0
+        assert result.columns == ["retention_time", "mz"]
+
+    def test_window_overlapping_data_is_evaluated(self, heatmap):
+        """A window that overlaps the extent still selects points."""
+        x_min, x_max = heatmap._preprocessed_data["x_range"]
+        assert not heatmap._is_outside_data_range(x_max - 1, x_max + 10, 0, 5000)
+        assert heatmap._is_outside_data_range(x_min - 10, x_min - 1, 0, 5000)
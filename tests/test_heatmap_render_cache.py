@@ -0,0 +1,190 @@
+"""Tests for the Heatmap render cache keyed by zoom and filter state."""
+
+import polars as pl
+import pytest
+
+from openms_insight import Heatmap
+from openms_insight.components import heatmap as heatmap_module
+
+
+@pytest.fixture
+def heatmap(mock_streamlit, temp_cache_dir, sample_heatmap_data) -> Heatmap:
+    """Heatmap with a scan_id filter and a small min_points."""
+    return Heatmap(
+        cache_id="test_render_cache",
+        data=sample_heatmap_data,
+        cache_path=str(temp_cache_dir),
+        x_column="retention_time",
+        y_column="mz",
+        intensity_column="intensity",
+        filters={"spectrum": "scan_id"},
+        min_points=100,
+    )
+
+
+class TestRenderCache:
+    """Tests for memoization of _prepare_vue_data."""
+
+    def test_repeated_state_is_served_from_cache(self, heatmap, monkeypatch):
+        """Identical zoom/filter state does not recompute the payload."""
+        state = {"spectrum": 3, "heatmap_zoom": None}
+        first = heatmap._prepare_vue_data(state)
+
+        def fail(_state):
+            raise AssertionError("payload should come from the render cache")
+
+        monkeypatch.setattr(heatmap, "_compute_vue_data", fail)
+        second = heatmap._prepare_vue_data(state)
+
+        assert second["_hash"] == first["_hash"]
+        assert second["heatmapData"].equals(first["heatmapData"])
+
+    def test_unrelated_state_keys_hit_cache(self, heatmap, monkeypatch):
+        """State keys that are neither zoom nor filters do not affect the key."""
+        first = heatmap._prepare_vue_data({"spectrum": 3})
+        monkeypatch.setattr(heatmap, "_compute_vue_data", None)
+        second = heatmap._prepare_vue_data({"spectrum": 3, "peak": 42})
+        assert second["_hash"] == first["_hash"]
+
+    def test_filter_change_misses_cache(self, heatmap):
+        """A different filter value produces a different payload."""
+        first = heatmap._prepare_vue_data({"spectrum": 3})
+        second = heatmap._prepare_vue_data({"spectrum": 4})
+        assert first["_hash"] != second["_hash"]
+
+    def test_zoom_change_misses_cache(self, heatmap):
+        """A different zoom range produces a different payload."""
+        full = heatmap._prepare_vue_data({"spectrum": 3})
+        zoomed = heatmap._prepare_vue_data(
+            {
+                "spectrum": 3,
+                "heatmap_zoom": {"xRange": [0, 50], "yRange": [100, 1000]},
+            }
+        )
+        assert zoomed["_hash"] != full["_hash"]
+        assert zoomed["heatmapData"]["retention_time"].max() <= 50
+
+    def test_cached_payload_dict_is_not_shared(self, heatmap):
+        """Callers may mutate the returned dict without corrupting the cache."""
+        state = {"spectrum": 3}
+        first = heatmap._prepare_vue_data(state)
+        first.pop("heatmapData")
+        second = heatmap._prepare_vue_data(state)
+        assert "heatmapData" in second
+
+    def test_cached_frame_is_not_shared(self, heatmap):
+        """Modifying a returned frame leaves the next cache hit unchanged."""
+        state = {"spectrum": 3}
+        first = heatmap._prepare_vue_data(state)
+        expected = first["heatmapData"].copy()
+        first["heatmapData"]["intensity"] = 0.0
+        first["heatmapData"].drop(index=first["heatmapData"].index[:5], inplace=True)
+
+        second = heatmap._prepare_vue_data(state)
+        assert second["heatmapData"] is not first["heatmapData"]
+        assert second["heatmapData"].equals(expected)
+
+    def test_regenerated_cache_is_not_served_stale(
+        self, mock_streamlit, temp_cache_dir
+    ):
+        """Regenerating the cache with new data invalidates cached payloads."""
+        kwargs = {
+            "cache_id": "test_render_cache_regen",
+            "cache_path": str(temp_cache_dir),
+            "x_column": "x",
+            "y_column": "y",
+            "intensity_column": "intensity",
+            "regenerate_cache": True,
+        }
+        old = Heatmap(
+            data=pl.LazyFrame({"x": [1.0], "y": [1.0], "intensity": [1.0]}),
+            **kwargs,
+        )
+        old._prepare_vue_data({})
+
+        new = Heatmap(
+            data=pl.LazyFrame(
+                {"x": [1.0, 2.0], "y": [1.0, 2.0], "intensity": [1.0, 2.0]}
+            ),
+            **kwargs,
+        )
+        assert len(new._prepare_vue_data({})["heatmapData"]) == 2
+
+    def test_cache_is_bounded(self, heatmap):
+        """The render cache never grows past its maximum size."""
+        for i in range(heatmap_module._RENDER_CACHE_MAX_ENTRIES + 5):
+            heatmap._prepare_vue_data({"spectrum": i})
+        assert (
+            len(heatmap_module._render_cache)
+            <= heatmap_module._RENDER_CACHE_MAX_ENTRIES
+        )
+
+    def test_cache_build_does_not_render(
+        self, mock_streamlit, temp_cache_dir, sample_heatmap_data, monkeypatch
+    ):
+        """Building the cache computes no payload; the first render fills it."""
+
+        def fail(self, _state):
+            raise AssertionError("cache creation should not render a payload")
+
+        monkeypatch.setattr(Heatmap, "_compute_vue_data", fail)
+        unfiltered = Heatmap(
+            cache_id="test_render_cache_lazy",
+            data=sample_heatmap_data,
+            cache_path=str(temp_cache_dir),
+            x_column="retention_time",
+            y_column="mz",
+            intensity_column="intensity",
+            min_points=100,
+        )
+        monkeypatch.undo()
+
+        first = unfiltered._prepare_vue_data({"heatmap_zoom": None})
+        monkeypatch.setattr(unfiltered, "_compute_vue_data", None)
+        second = unfiltered._prepare_vue_data({})
+        assert len(first["heatmapData"]) > 0
+        assert second["_hash"] == first["_hash"]
+
+    @pytest.mark.parametrize(
+        "zoom",
+        [
+            None,
+            {},
+            {"xRange": [-1, -1], "yRange": [-1, -1]},
+            {"xRange": [10, 20]},
+        ],
+    )
+    def test_full_view_states_share_key(self, heatmap, zoom):
+        """Every representation of the full view maps to the same cache key."""
+        assert heatmap._is_no_zoom(zoom)
+        assert heatmap_module._make_zoom_cache_key(zoom) == ()
+
+    def test_zoom_key_is_flat_bounds(self):
+        """A zoomed state keys on its four bounds."""
+        zoom = {"xRange": [1.5, 2.5], "yRange": [100, 200]}
+        assert heatmap_module._make_zoom_cache_key(zoom) == (1.5, 2.5, 100, 200)
+
+    def test_near_identical_zooms_share_key(self, heatmap, monkeypatch):
+        """Sub-pixel differences in the zoom bounds hit the same cache entry."""
+        zoom = {"xRange": [10.123456, 60.987654], "yRange": [200.00001, 1800.4]}
+        jittered = {"xRange": [10.123461, 60.987649], "yRange": [200.00004, 1800.4]}
+        assert heatmap_module._make_zoom_cache_key(
+            zoom
+        ) == heatmap_module._make_zoom_cache_key(jittered)
+        assert heatmap_module._make_zoom_cache_key(zoom) == (10.12, 60.99, 200, 1800)
+
+        first = heatmap._prepare_vue_data({"spectrum": 3, "heatmap_zoom": zoom})
+        monkeypatch.setattr(heatmap, "_compute_vue_data", None)
+        second = heatmap._prepare_vue_data({"spectrum": 3, "heatmap_zoom": jittered})
+        assert second["_hash"] == first["_hash"]
+
+    def test_cache_token_does_not_reread_manifest(self, heatmap, monkeypatch):
+        """The cache token uses the creation time parsed at cache load."""
+        import json
+
+        with open(heatmap._get_manifest_path()) as f:
+            created_at = json.load(f)["created_at"]
+
+        heatmap._cache_token = None
+        monkeypatch.setattr(heatmap, "_get_manifest_path", None)
+        assert heatmap._get_cache_token() == (str(heatmap._cache_dir), created_at)
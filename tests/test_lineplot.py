@@ -0,0 +1,344 @@
+"""Tests for LinePlot component."""
+
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from openms_insight import LinePlot
+
+
+class TestDynamicAnnotations:
+    """Tests for render-time annotations keyed by peak_id."""
+
+    def test_annotations_follow_peak_id(
+        self,
+        mock_streamlit,
+        temp_cache_dir: Path,
+        sample_lineplot_data: pl.LazyFrame,
+    ):
+        """Annotated peaks are matched by id, not by row position."""
+        plot = LinePlot(
+            cache_id="test_lineplot_dynamic",
+            data=sample_lineplot_data,
+            interactivity={"peak": "peak_id"},
+            x_column="mass",
+            y_column="intensity",
+            cache_path=str(temp_cache_dir),
+        )
+        plot.set_dynamic_annotations(
+            {
+                30: {"highlight": True, "annotation": "y3"},
+                50: {"highlight": True, "annotation": "b4"},
+                99: {"highlight": True, "annotation": "missing"},
+            }
+        )
+
+        df = plot._prepare_vue_data({})["plotData"]
+
+        assert df["_dynamic_highlight"].tolist() == [False, False, True, False, True]
+        assert df["_dynamic_annotation"].tolist() == ["", "", "y3", "", "b4"]
+
+    def test_fresh_annotations_match_prepare(
+        self,
+        mock_streamlit,
+        temp_cache_dir: Path,
+        sample_lineplot_data: pl.LazyFrame,
+    ):
+        """Re-applying annotations to cached data gives the same columns."""
+        plot = LinePlot(
+            cache_id="test_lineplot_fresh",
+            data=sample_lineplot_data,
+            interactivity={"peak": "peak_id"},
+            x_column="mass",
+            y_column="intensity",
+            cache_path=str(temp_cache_dir),
+        )
+        plot.set_dynamic_annotations({20: {"highlight": True, "annotation": "b2"}})
+
+        prepared = plot._prepare_vue_data({})
+        fresh = plot._apply_fresh_annotations(plot._strip_dynamic_columns(prepared))
+
+        assert fresh["plotData"].equals(prepared["plotData"])
+        assert fresh["_plotConfig"] == prepared["_plotConfig"]
+
+
+class TestRawColumnNames:
+    """Tests for the memoized raw data schema."""
+
+    def test_schema_resolved_once_per_raw_data(
+        self,
+        mock_streamlit,
+        temp_cache_dir: Path,
+        sample_lineplot_data: pl.LazyFrame,
+    ):
+        """Validation steps share one schema lookup until the data changes."""
+        plot = LinePlot(
+            cache_id="test_lineplot_schema",
+            data=sample_lineplot_data,
+            x_column="mass",
+            y_column="intensity",
+            cache_path=str(temp_cache_dir),
+        )
+
+        class CountingFrame:
+            calls = 0
+
+            def collect_schema(self):
+                CountingFrame.calls += 1
+                return sample_lineplot_data.collect_schema()
+
+        plot._raw_data = CountingFrame()
+        plot._validate_mappings()
+        plot._validate_mappings()
+        assert CountingFrame.calls == 1
+
+        plot._raw_data = CountingFrame()
+        assert "peak_id" in plot._get_raw_column_names()
+        assert CountingFrame.calls == 2
+
+
+class TestStyling:
+    """Tests for the merged styling."""
+
+    def test_with_styling_refreshes_merged_styling(
+        self,
+        mock_streamlit,
+        temp_cache_dir: Path,
+        sample_lineplot_data: pl.LazyFrame,
+    ):
+        """Styling changes after the first merge are picked up."""
+        plot = LinePlot(
+            cache_id="test_lineplot_styling",
+            data=sample_lineplot_data,
+            x_column="mass",
+            y_column="intensity",
+            cache_path=str(temp_cache_dir),
+        )
+        styling = plot._get_styling()
+        assert styling["highlightColor"] == "#E4572E"
+        assert styling["annotationColors"]["massButton"] == "#E4572E"
+
+        plot.with_styling(highlight_color="#123456").with_annotations(
+            button_color="#654321"
+        )
+        styling = plot._get_styling()
+        assert styling["highlightColor"] == "#123456"
+        assert styling["annotationColors"]["massButton"] == "#654321"
+        assert styling["annotationColors"]["background"] == "#f0f0f0"
+
+    def test_defaults_not_shared_between_instances(
+        self,
+        mock_streamlit,
+        temp_cache_dir: Path,
+        sample_lineplot_data: pl.LazyFrame,
+    ):
+        """Changing one instance's styling leaves a fresh instance's defaults."""
+        plot = LinePlot(
+            cache_id="test_lineplot_styling_shared",
+            data=sample_lineplot_data,
+            x_column="mass",
+            y_column="intensity",
+            cache_path=str(temp_cache_dir),
+        )
+        colors = plot._get_styling()["annotationColors"]
+        colors["massButton"] = "#000000"
+        colors["background"] = "#111111"
+
+        fresh = LinePlot(
+            cache_id="test_lineplot_styling_fresh",
+            data=sample_lineplot_data,
+            x_column="mass",
+            y_column="intensity",
+            cache_path=str(temp_cache_dir),
+        )
+        colors = fresh._get_styling()["annotationColors"]
+        assert colors["massButton"] == "#E4572E"
+        assert colors["background"] == "#f0f0f0"
+
+
+class TestMaxPoints:
+    """Tests for the optional per-render peak cap."""
+
+    def test_keeps_tallest_peaks_in_order(
+        self,
+        mock_streamlit,
+        temp_cache_dir: Path,
+        sample_lineplot_data: pl.LazyFrame,
+    ):
+        """Only the tallest peaks are sent, in their original order."""
+        plot = LinePlot(
+            cache_id="test_lineplot_max_points",
+            data=sample_lineplot_data,
+            x_column="mass",
+            y_column="intensity",
+            cache_path=str(temp_cache_dir),
+            max_points=3,
+        )
+
+        df = plot._prepare_vue_data({})["plotData"]
+
+        assert df["mass"].tolist() == [200.0, 300.0, 400.0]
+
+    def test_highlighted_peaks_are_kept(
+        self,
+        mock_streamlit,
+        temp_cache_dir: Path,
+        sample_lineplot_data: pl.LazyFrame,
+    ):
+        """Highlighted peaks survive the cap even when they are small."""
+        data = sample_lineplot_data.with_columns(
+            (pl.col("peak_id") == 50).alias("is_match")
+        )
+        plot = LinePlot(
+            cache_id="test_lineplot_max_points_highlight",
+            data=data,
+            x_column="mass",
+            y_column="intensity",
+            highlight_column="is_match",
+            cache_path=str(temp_cache_dir),
+            max_points=2,
+        )
+
+        df = plot._prepare_vue_data({})["plotData"]
+
+        assert df["mass"].tolist() == [400.0, 500.0]
+
+    def test_annotated_peaks_are_kept(
+        self,
+        mock_streamlit,
+        temp_cache_dir: Path,
+        sample_lineplot_data: pl.LazyFrame,
+    ):
+        """Dynamically annotated peaks survive the cap like highlighted ones."""
+        plot = LinePlot(
+            cache_id="test_lineplot_max_points_annotated",
+            data=sample_lineplot_data,
+            interactivity={"peak": "peak_id"},
+            x_column="mass",
+            y_column="intensity",
+            cache_path=str(temp_cache_dir),
+            max_points=2,
+        )
+        plot.set_dynamic_annotations({50: {"highlight": True, "annotation": "b4"}})
+
+        df = plot._prepare_vue_data({})["plotData"]
+
+        assert df["mass"].tolist() == [400.0, 500.0]
+        assert df["_dynamic_annotation"].tolist() == ["", "b4"]
+
+    def test_hash_describes_limited_frame(
+        self,
+        mock_streamlit,
+        temp_cache_dir: Path,
+        sample_lineplot_data: pl.LazyFrame,
+    ):
+        """The data hash is computed from the peaks that are sent."""
+        from openms_insight.preprocessing.filtering import compute_dataframe_hash
+
+        plot = LinePlot(
+            cache_id="test_lineplot_max_points_hash",
+            data=sample_lineplot_data,
+            x_column="mass",
+            y_column="intensity",
+            cache_path=str(temp_cache_dir),
+            max_points=3,
+        )
+
+        payload = plot._prepare_vue_data({})
+
+        sent = pl.from_pandas(payload["plotData"])
+        assert payload["_hash"] == compute_dataframe_hash(sent)
+
+    @pytest.mark.parametrize("max_points", [0, -1, 2.5, True])
+    def test_invalid_max_points_rejected(
+        self,
+        mock_streamlit,
+        temp_cache_dir: Path,
+        sample_lineplot_data: pl.LazyFrame,
+        max_points,
+    ):
+        """max_points must be a positive integer."""
+        with pytest.raises(ValueError, match="max_points"):
+            LinePlot(
+                cache_id="test_lineplot_max_points_invalid",
+                data=sample_lineplot_data,
+                x_column="mass",
+                y_column="intensity",
+                cache_path=str(temp_cache_dir),
+                max_points=max_points,
+            )
+
+    def test_max_points_restored_from_cache(
+        self,
+        mock_streamlit,
+        temp_cache_dir: Path,
+        sample_lineplot_data: pl.LazyFrame,
+    ):
+        """max_points survives reconstruction from cache."""
+        LinePlot(
+            cache_id="test_lineplot_max_points_cache",
+            data=sample_lineplot_data,
+            x_column="mass",
+            y_column="intensity",
+            cache_path=str(temp_cache_dir),
+            max_points=2,
+        )
+
+        restored = LinePlot(
+            cache_id="test_lineplot_max_points_cache",
+            cache_path=str(temp_cache_dir),
+        )
+
+        assert restored._max_points == 2
+        assert len(restored._prepare_vue_data({})["plotData"]) == 2
+
+
+class TestPreprocess:
+    """Tests for the cached LinePlot data."""
+
+    def test_cache_keeps_only_rendered_columns(
+        self,
+        mock_streamlit,
+        temp_cache_dir: Path,
+        sample_lineplot_data: pl.LazyFrame,
+    ):
+        """Source columns the plot never reads are not written to the cache."""
+        plot = LinePlot(
+            cache_id="test_lineplot_projection",
+            data=sample_lineplot_data,
+            filters={"spectrum": "scan_id"},
+            x_column="mass",
+            y_column="intensity",
+            cache_path=str(temp_cache_dir),
+        )
+
+        columns = plot._preprocessed_data["data"].collect_schema().names()
+
+        assert columns == ["mass", "intensity", "scan_id"]
+
+
+class TestPlotConfig:
+    """Tests for the _plotConfig column mapping."""
+
+    def test_interactivity_columns_built_once(
+        self,
+        mock_streamlit,
+        temp_cache_dir: Path,
+        sample_lineplot_data: pl.LazyFrame,
+    ):
+        """Every _plotConfig shares one interactivity column mapping."""
+        plot = LinePlot(
+            cache_id="test_lineplot_plot_config",
+            data=sample_lineplot_data,
+            interactivity={"peak": "peak_id", "scan": "scan_id"},
+            x_column="mass",
+            y_column="intensity",
+            cache_path=str(temp_cache_dir),
+        )
+
+        first = plot._build_plot_config(None, None)["interactivityColumns"]
+        second = plot._build_plot_config("h", "a")["interactivityColumns"]
+
+        assert first == {"peak_id": "peak_id", "scan_id": "scan_id"}
+        assert first is second
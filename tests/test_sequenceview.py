@@ -1,5 +1,6 @@
 """Tests for SequenceView component behavior."""
 
+from collections import OrderedDict
 from pathlib import Path
 
 import polars as pl
@@ -174,3 +175,147 @@ class TestSequenceViewEmptyState:
         assert sequence == "", (
             "Should return empty when any filter with None default is None"
         )
+
+
+class TestFragmentMassesFallback:
+    """Tests for fragment masses computed without pyOpenMS."""
+
+    def test_prefix_and_suffix_series(self):
+        """b/y ions are running residue sums from either terminus."""
+        from openms_insight.components.sequenceview import (
+            AA_MASSES,
+            ION_OFFSETS,
+            _calculate_fragment_masses_simple,
+        )
+
+        result = _calculate_fragment_masses_simple("PEK")
+
+        p, e, k = AA_MASSES["P"], AA_MASSES["E"], AA_MASSES["K"]
+        b_ions = [m[0] for m in result["fragment_masses_b"]]
+        y_ions = [m[0] for m in result["fragment_masses_y"]]
+        assert b_ions == [p, p + e, p + e + k]
+        assert y_ions == [
+            k + ION_OFFSETS["y"],
+            k + e + ION_OFFSETS["y"],
+            k + e + p + ION_OFFSETS["y"],
+        ]
+        assert all(len(result[f"fragment_masses_{t}"]) == 3 for t in "abcxyz")
+
+    def test_unknown_residues_weigh_nothing(self):
+        """Residues without a known mass contribute 0.0."""
+        from openms_insight.components.sequenceview import (
+            AA_MASSES,
+            _calculate_fragment_masses_simple,
+        )
+
+        result = _calculate_fragment_masses_simple("GXG")
+
+        b_ions = [m[0] for m in result["fragment_masses_b"]]
+        g = AA_MASSES["G"]
+        assert b_ions == [g, g, g + g]
+
+
+class TestSequenceMassCache:
+    """Tests for the per-sequence mass memoization."""
+
+    def test_sequence_is_fragmented_once(self, monkeypatch):
+        """Repeated lookups of one sequence reuse the first computation."""
+        from openms_insight.components import sequenceview
+
+        calls = []
+        original = sequenceview.calculate_fragment_masses_pyopenms
+
+        def counting(sequence_str):
+            calls.append(sequence_str)
+            return original(sequence_str)
+
+        monkeypatch.setattr(
+            sequenceview, "calculate_fragment_masses_pyopenms", counting
+        )
+        monkeypatch.setattr(sequenceview, "_sequence_cache", OrderedDict())
+
+        first = sequenceview._get_sequence_masses("PEPTIDEK")
+        second = sequenceview._get_sequence_masses("PEPTIDEK")
+
+        assert calls == ["PEPTIDEK"]
+        assert first is second
+        assert first[0] == list("PEPTIDEK")
+
+    def test_failed_sequence_is_not_cached(self, monkeypatch):
+        """A failed computation is retried on the next lookup."""
+        from openms_insight.components import sequenceview
+
+        original = sequenceview.get_theoretical_mass
+        monkeypatch.setattr(sequenceview, "get_theoretical_mass", lambda _s: 0.0)
+        monkeypatch.setattr(sequenceview, "_sequence_cache", OrderedDict())
+
+        failed = sequenceview._get_sequence_masses("PEPTIDEK")
+        assert failed[3] == 0.0
+        assert "PEPTIDEK" not in sequenceview._sequence_cache
+
+        monkeypatch.setattr(sequenceview, "get_theoretical_mass", original)
+        recovered = sequenceview._get_sequence_masses("PEPTIDEK")
+        assert recovered[3] > 0
+        assert "PEPTIDEK" in sequenceview._sequence_cache
+
+    def test_empty_fragments_are_not_cached(self, monkeypatch):
+        """Empty fragment lists from the error path are not stored."""
+        from openms_insight.components import sequenceview
+
+        monkeypatch.setattr(
+            sequenceview,
+            "calculate_fragment_masses_pyopenms",
+            lambda _s: {f"fragment_masses_{ion}": [] for ion in "abcxyz"},
+        )
+        monkeypatch.setattr(sequenceview, "_sequence_cache", OrderedDict())
+
+        sequenceview._get_sequence_masses("PEPTIDEK")
+        assert "PEPTIDEK" not in sequenceview._sequence_cache
+
+
+class TestSequenceViewHash:
+    """Tests for the change-detection hash sent to Vue."""
+
+    def test_hash_changes_with_peak_masses(self, temp_cache_dir: Path):
+        """Spectra of one peptide with equally many peaks hash differently."""
+        from openms_insight.components.sequenceview import SequenceView
+
+        sv = SequenceView(
+            cache_id="test_sv_hash",
+            sequence_data=pl.LazyFrame(
+                {
+                    "scan_id": [1, 2],
+                    "sequence": ["PEPTIDE", "PEPTIDE"],
+                    "precursor_charge": [2, 2],
+                }
+            ),
+            peaks_data=pl.LazyFrame(
+                {
+                    "scan_id": [1, 1, 2, 2],
+                    "peak_id": [1, 2, 3, 4],
+                    "mass": [100.0, 200.0, 110.0, 210.0],
+                }
+            ),
+            cache_path=str(temp_cache_dir),
+            filters={"spectrum": "scan_id"},
+        )
+
+        first = sv._prepare_vue_data({"spectrum": 1})["_hash"]
+        second = sv._prepare_vue_data({"spectrum": 2})["_hash"]
+
+        assert first != second
+        assert sv._prepare_vue_data({"spectrum": 1})["_hash"] == first
+
+    def test_hash_stable_with_string_peak_ids(self, temp_cache_dir: Path):
+        """String peak ids hash by value, so identical calls agree."""
+        from openms_insight.components.sequenceview import SequenceView
+
+        sv = SequenceView(
+            cache_id="test_sv_hash_strings",
+            sequence_data="PEPTIDE",
+            peaks_data=pl.LazyFrame({"peak_id": ["p1", "p2"], "mass": [100.0, 200.0]}),
+            cache_path=str(temp_cache_dir),
+        )
+
+        first = sv._prepare_vue_data({})["_hash"]
+        assert sv._prepare_vue_data({})["_hash"] == first
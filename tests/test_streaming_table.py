@@ -4,6 +4,8 @@ These tests verify that the Table component correctly implements server-side
 pagination where only the current page of data is sent to the frontend.
 """
 
+from datetime import datetime
+
 import polars as pl
 import pytest
 
@@ -386,6 +388,36 @@ class TestStreamingTableColumnMetadata:
         assert "unique_values" in metadata["category"]
         assert set(metadata["category"]["unique_values"]) == {"A", "B", "C"}
 
+    def test_auto_column_sorters(self, mock_streamlit, temp_cache_dir):
+        """Auto-generated column definitions pick the sorter from the dtype."""
+        data = pl.LazyFrame(
+            {
+                "count": [1, 2],
+                "score": [0.5, 1.5],
+                "flag": [True, False],
+                "when": [datetime(2024, 1, 1), datetime(2024, 1, 2)],
+                "label": ["a", "b"],
+            }
+        ).with_columns(pl.col("when").dt.replace_time_zone("UTC"))
+        table = Table(
+            cache_id="test_streaming_auto_sorters",
+            data=data,
+            cache_path=str(temp_cache_dir),
+        )
+
+        sorters = {
+            col_def["field"]: (col_def["sorter"], col_def.get("hozAlign"))
+            for col_def in table._column_definitions
+        }
+
+        assert sorters == {
+            "count": ("number", "right"),
+            "score": ("number", "right"),
+            "flag": ("boolean", None),
+            "when": ("date", None),
+            "label": ("string", None),
+        }
+
     def test_pagination_identifier_in_args(
         self, mock_streamlit, temp_cache_dir, large_table_data
     ):